@@ -0,0 +1,154 @@
+"""
+Advent of Code 2022: benchmark all days
+"""
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+
+from loader import load_parse_input
+from run_all import get_days, get_input_file, load_solution
+
+
+STAGES: tuple[str, ...] = ('parse', 'part1', 'part2')
+
+
+def summarize(samples: list[int]) -> dict[str, int]:
+    """
+    Summarize timing samples into their min, median and 95th percentile.
+    :param samples: The measured durations in nanoseconds.
+    :return: The summary statistics in nanoseconds.
+    """
+    ordered = sorted(samples)
+
+    # Nearest-rank percentile
+    p95_idx = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return {
+        'min_ns': ordered[0],
+        'median_ns': int(statistics.median(ordered)),
+        'p95_ns': ordered[p95_idx],
+    }
+
+
+def benchmark_day(day: str, repeat: int, warmup: int, scale: int = None) -> dict[str, dict[str, int]]:
+    """
+    Benchmark the parse, part 1 and part 2 stages of a day.
+    :param day: The name of the solution folder.
+    :param repeat: The number of timed repetitions per stage.
+    :param warmup: The number of untimed repetitions before measuring.
+    :param scale: The scale of a generated input to use instead of the puzzle input, if any.
+    :return: The summary statistics per stage.
+    """
+    solution = load_solution(day)
+    text = load_parse_input(solution, get_input_file(day, scale))
+
+    samples: dict[str, list[int]] = {stage: [] for stage in STAGES}
+    for i in range(warmup + repeat):
+        start = time.perf_counter_ns()
+        parsed = solution.parse(text)
+        parse_end = time.perf_counter_ns()
+        solution.part1(parsed)
+        part1_end = time.perf_counter_ns()
+        solution.part2(parsed)
+        part2_end = time.perf_counter_ns()
+
+        # Discard warm-up runs
+        if i < warmup:
+            continue
+
+        samples['parse'].append(parse_end - start)
+        samples['part1'].append(part1_end - parse_end)
+        samples['part2'].append(part2_end - part1_end)
+
+    return {stage: summarize(stage_samples) for stage, stage_samples in samples.items()}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compare benchmark results against a baseline on their median.
+    :param results: The benchmark results per day and stage.
+    :param baseline: The baseline results per day and stage.
+    :param threshold: The relative slowdown above which a stage counts as a regression.
+    :return: A description of each regression found.
+    """
+    regressions: list[str] = []
+
+    for day, stages in results.items():
+        for stage, stats in stages.items():
+            base_stats = baseline.get(day, {}).get(stage)
+
+            # Not measured in the baseline
+            if not base_stats or not base_stats['median_ns']:
+                continue
+
+            change = stats['median_ns'] / base_stats['median_ns'] - 1
+            if change > threshold:
+                regressions.append(f'{day} {stage}: {change:+.1%}')
+
+    return regressions
+
+
+def print_results(results: dict, baseline: dict | None) -> None:
+    """
+    Print the benchmark results as a table, including the change of the median relative to the baseline.
+    :param results: The benchmark results per day and stage.
+    :param baseline: The baseline results per day and stage, if any.
+    """
+    print('-'*62)
+    print(f'| {"Day":3} | {"Stage":5} | {"Min (ms)":9} | {"Median (ms)":11} | {"P95 (ms)":9} | {"Change":7} |')
+    print('-'*62)
+    for day, stages in results.items():
+        for stage, stats in stages.items():
+            base_stats = (baseline or {}).get(day, {}).get(stage)
+            change = ''
+            if base_stats and base_stats['median_ns']:
+                change = f'{stats["median_ns"] / base_stats["median_ns"] - 1:+.1%}'
+
+            print(f'| {day.replace("day", ""):>3} | {stage:5} | {stats["min_ns"] / 1e6:>9.3f} '
+                  f'| {stats["median_ns"] / 1e6:>11.3f} | {stats["p95_ns"] / 1e6:>9.3f} | {change:>7} |')
+    print('-'*62)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the Advent of Code 2022 solutions.')
+    parser.add_argument('days', nargs='*', type=int, help='day numbers to benchmark (default: all)')
+    parser.add_argument('-n', '--repeat', type=int, default=10, help='timed repetitions per day (default: 10)')
+    parser.add_argument('-w', '--warmup', type=int, default=1, help='warm-up repetitions per day (default: 1)')
+    parser.add_argument('-s', '--scale', type=int,
+                        help='benchmark the generated input of this scale instead of input.txt')
+    parser.add_argument('-o', '--output', default='benchmark.json',
+                        help='file to write the results to (default: benchmark.json)')
+    parser.add_argument('-b', '--baseline', help='results file to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.10,
+                        help='relative slowdown of the median flagged as regression (default: 0.10)')
+    args = parser.parse_args()
+
+    days = [f'day{day}' for day in args.days] if args.days else get_days()
+    results = {day: benchmark_day(day, args.repeat, args.warmup, args.scale) for day in days}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    print_results(results, baseline)
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+            'scale': args.scale,
+            'results': results,
+        }, f, indent=2)
+
+    # Flag regressions, failing the run so it can be used as a check
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            sys.exit(1)
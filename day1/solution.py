@@ -1,22 +1,169 @@
 """
 Advent of Code 2022: day 1
 """
+import argparse
+import heapq
+import mmap
 import os
+import sys
 
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Iterable, Iterator
 
-calories = [
-    sum([                                 # Sum up cluster
-        int(calories)                     # Transform to int
-        for calories in elf.splitlines()  # Split single caloric items
-        if calories                       # Ignore empty string
-    ])
-    for elf in open(input_file).read().split('\n\n')  # Divide input into clusters
-]
-calories.sort()
 
-# Reverse and take top 3
-top3 = calories[:-4:-1]
+def top_calories(lines: Iterable[str | bytes], k: int = 3) -> list[int]:
+    """
+    Get the calories carried by the top k elves, streaming over the calorie lines.
+    Only a min-heap of the k largest totals is kept, so memory use does not grow with the input.
+    :param lines: The lines of the calorie list, e.g. an open (binary) file or stdin.
+    :param k: The number of elves to keep.
+    :return: The calories of the top k elves, in descending order.
+    """
+    heap: list[int] = []
+    total, has_items = 0, False
 
-print(f'part1: {top3[0]}')
-print(f'part2: {sum(top3)}')
+    for line in lines:
+        line = line.strip()
+
+        # Caloric item of the current elf
+        if line:
+            total += int(line)
+            has_items = True
+            continue
+
+        # End of an elf, replace the smallest kept total if it was carrying more
+        if has_items:
+            heapq.heappush(heap, total) if len(heap) < k else heapq.heappushpop(heap, total)
+        total, has_items = 0, False
+
+    # The last elf is not followed by an empty line
+    if has_items:
+        heapq.heappush(heap, total) if len(heap) < k else heapq.heappushpop(heap, total)
+
+    return sorted(heap, reverse=True)
+
+
+def iter_lines(data: bytes | mmap.mmap, start: int, end: int) -> Iterator[bytes]:
+    """
+    Iterate over the lines in a range of a buffer, without copying the range as a whole.
+    :param data: The buffer, e.g. a memory-mapped file.
+    :param start: The index of the first byte of the range.
+    :param end: The index after the last byte of the range.
+    :return: The lines, without line endings.
+    """
+    while start < end:
+        line_end = data.find(b'\n', start, end)
+        line_end = end if line_end == -1 else line_end
+        yield data[start:line_end]
+        start = line_end + 1
+
+
+def split_on_elves(data: bytes | mmap.mmap, n_chunks: int) -> list[tuple[int, int]]:
+    """
+    Split a calorie list into roughly equal chunks, each starting at the first line of an elf.
+    :param data: The calorie list, e.g. a memory-mapped file.
+    :param n_chunks: The number of chunks to aim for, fewer are returned for small inputs.
+    :return: The start and end index of each chunk.
+    """
+    boundaries = [0]
+    for i in range(1, n_chunks):
+        # Move the boundary forward to the next empty line
+        boundary = data.find(b'\n\n', max(boundaries[-1], len(data) * i // n_chunks))
+        if boundary == -1:
+            break
+        boundaries.append(boundary + 2)
+    boundaries.append(len(data))
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def top_calories_in_chunk(input_file: str, start: int, end: int, k: int) -> list[int]:
+    """
+    Get the calories carried by the top k elves in a chunk of a calorie list file.
+    :param input_file: The path of the calorie list.
+    :param start: The index of the first byte of the chunk.
+    :param end: The index after the last byte of the chunk.
+    :param k: The number of elves to keep.
+    :return: The calories of the top k elves in the chunk, in descending order.
+    """
+    with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return top_calories(iter_lines(data, start, end), k)
+
+
+def top_calories_parallel(input_file: str, k: int = 3, n_chunks: int = None) -> list[int]:
+    """
+    Get the calories carried by the top k elves, processing chunks of a memory-mapped file in worker processes.
+    Gives the same result as sorting all totals, for any number of chunks.
+    :param input_file: The path of the calorie list.
+    :param k: The number of elves to keep.
+    :param n_chunks: The number of chunks to process in parallel, defaults to the number of CPUs.
+    :return: The calories of the top k elves, in descending order.
+    """
+    # Empty files cannot be memory-mapped
+    if os.path.getsize(input_file) == 0:
+        return []
+
+    n_chunks = n_chunks or os.cpu_count()
+    with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        chunks = split_on_elves(data, n_chunks)
+
+    # Merge the partial top k of each chunk
+    starts, ends = zip(*chunks)
+    with ProcessPoolExecutor(max_workers=min(len(chunks), os.cpu_count())) as executor:
+        partials = executor.map(top_calories_in_chunk, repeat(input_file), starts, ends, repeat(k))
+        return heapq.nlargest(k, chain.from_iterable(partials))
+
+
+def parse(text: str) -> list[int]:
+    """
+    Parse the input into the calories carried by the top 3 elves.
+    :param text: The raw puzzle input.
+    :return: The calories of the top 3 elves, in descending order.
+    """
+    return top_calories(text.splitlines())
+
+
+def part1(calories: list[int]) -> int:
+    """
+    Get the calories carried by the elf carrying the most.
+    :param calories: The calories of the top elves, in descending order.
+    :return: The highest amount of calories.
+    """
+    return calories[0]
+
+
+def part2(calories: list[int]) -> int:
+    """
+    Get the calories carried by the top 3 elves.
+    :param calories: The calories of the top elves, in descending order.
+    :return: The sum of the top 3 amounts of calories.
+    """
+    return sum(calories[:3])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Advent of Code 2022: day 1')
+    parser.add_argument('input', nargs='?', help="calorie list to stream, '-' for stdin (default: input.txt)")
+    parser.add_argument('-k', type=int, default=3, help='number of top elves to report when streaming (default: 3)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of chunks of the calorie list to process in parallel (default: 1)')
+    args = parser.parse_args()
+
+    # Stream an arbitrarily large calorie list
+    if args.input:
+        if args.input == '-':
+            print(top_calories(sys.stdin.buffer, args.k))
+        elif args.jobs > 1:
+            print(top_calories_parallel(args.input, args.k, args.jobs))
+        else:
+            with open(args.input, 'rb') as f:
+                print(top_calories(f, args.k))
+        sys.exit()
+
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
+
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
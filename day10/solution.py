@@ -1,76 +1,125 @@
 """
 Advent of Code 2022: day 10
 """
+import argparse
 import os
+import sys
 
-from collections import deque
+from typing import Iterable
 
+import numpy as np
 
-def determine_signal(_instructions: deque[str]) -> list[int]:
+
+def compile_instructions(_instructions: Iterable[str]) -> np.ndarray:
     """
-    Computes the signal per cycle based on the given instructions.
+    Compile the instructions into the change of X at the end of each cycle.
     :param _instructions: The signal instructions given.
-    :return: The resulting signal.
+    :return: The change of X per cycle.
     """
-    # Initialize the signal with X=1
-    _signal: list[int] = [1]
+    # 'noop' takes one cycle, 'addx V' takes two and only changes X at the end of the second
+    deltas = [delta for instruction in _instructions if instruction
+              for delta in ((0,) if instruction == 'noop' else (0, int(instruction[5:])))]
+    return np.array(deltas, dtype=np.int64)
 
-    # Process all instructions
-    while len(_instructions) > 0:
-        instruction = _instructions.popleft()
 
-        # Wait one cycle
-        if instruction == 'noop':
-            _signal.append(_signal[-1])
-            continue
+def trace_register(deltas: np.ndarray) -> np.ndarray:
+    """
+    Compute the value of X during each cycle with a single cumulative sum, starting from X=1.
+    :param deltas: The change of X per cycle.
+    :return: The value of X during each cycle, the first cycle at index 0, followed by its value after the program.
+    """
+    return np.cumsum(np.concatenate(([1], deltas)))
 
-        # Wait two cycles and increment signal with X
-        x_to_add = int(instruction.split(' ')[1])
-        _signal.extend([_signal[-1], _signal[-1] + x_to_add])
 
-    return _signal
+def x_during(trace: np.ndarray, cycles: Iterable[int] | np.ndarray) -> np.ndarray:
+    """
+    Get the value of X during any set of cycles, X keeps its final value once the program has ended.
+    :param trace: The value of X during each cycle.
+    :param cycles: The cycles, starting from 1.
+    :return: The value of X during each cycle.
+    """
+    cycles = np.fromiter(cycles, dtype=np.int64) if not isinstance(cycles, np.ndarray) else cycles
+    if (cycles < 1).any():
+        raise ValueError('cycles start from 1')
+
+    return trace[np.minimum(cycles, len(trace)) - 1]
 
 
-def get_signal_strength(_signal: list[int], cycle: int) -> int:
+def signal_strengths(trace: np.ndarray, cycles: Iterable[int] | np.ndarray) -> np.ndarray:
     """
-    Computes the signal strength at the given cycle.
-    :param _signal: The signal in question.
-    :param cycle: The cycle to compute the signal strength for.
-    :return: The signal strength at the given cycle.
+    Compute the signal strength during any set of cycles.
+    :param trace: The value of X during each cycle.
+    :param cycles: The cycles, starting from 1.
+    :return: The signal strength during each cycle.
     """
-    return _signal[cycle-1] * cycle
+    cycles = np.fromiter(cycles, dtype=np.int64) if not isinstance(cycles, np.ndarray) else cycles
+    return x_during(trace, cycles) * cycles
 
 
-def render_CRT(_signal: list[int]) -> None:
+def render_crt(trace: np.ndarray, width: int = 40, height: int = 6,
+               lit: str = '█', dark: str = ' ') -> bytearray:
     """
-    Renders the signal on the CRT.
-    :param _signal: The signal to render.
+    Render the signal on a CRT of any size into a single buffer, drawing one pixel per cycle.
+    :param trace: The value of X during each cycle.
+    :param width: The number of pixels per CRT row.
+    :param height: The number of CRT rows.
+    :param lit: The character of a lit pixel, '█' instead of '#' for better readability.
+    :param dark: The character of a dark pixel, ' ' instead of '.' for better readability.
+    :return: The UTF-8 encoded image, every CRT row preceded by a newline.
     """
-    # 40x6 CRT display
-    for cycle in range(240):
-        curr_X = _signal[cycle]
+    cycles = np.arange(width * height)
+    sprite = x_during(trace, cycles + 1).reshape(height, width)
+
+    # Pixels lit by the 3 pixel wide sprite as 1, each row preceded by a newline column
+    frame = np.full((height, width + 1), ord('\n'), dtype=np.uint8)
+    frame[:, 1:] = np.abs(sprite - np.arange(width)) <= 1
+
+    return bytearray(frame.tobytes()).replace(b'\x01', lit.encode()).replace(b'\x00', dark.encode())
 
-        if (cycle + 1) % 40 == 1:
-            print('\n', end='')
 
-        # Render 3 pixel wide sprite if intersection is found
-        if curr_X - 1 <= cycle % 40 <= curr_X + 1:
-            print('█', end='')  # instead of '#' for better readability
-            continue
+def parse(text: str) -> np.ndarray:
+    """
+    Parse the instructions and compute the resulting signal.
+    :param text: The raw puzzle input.
+    :return: The value of X during each cycle.
+    """
+    return trace_register(compile_instructions(text.splitlines()))
+
+
+def part1(trace: np.ndarray) -> int:
+    """
+    Sum the signal strengths during the 20th, 60th, 100th, 140th, 180th and 220th cycles.
+    :param trace: The value of X during each cycle.
+    :return: The sum of the signal strengths.
+    """
+    return int(signal_strengths(trace, range(20, 221, 40)).sum())
+
+
+def part2(trace: np.ndarray) -> str:
+    """
+    Render the image produced by the signal on the CRT.
+    :param trace: The value of X during each cycle.
+    :return: The rendered image.
+    """
+    return render_crt(trace).decode()
+
 
-        # Render background
-        print(' ', end='')  # instead of '.' for better readability
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Advent of Code 2022: day 10')
+    parser.add_argument('input', nargs='?', default=os.path.join(os.path.dirname(__file__), 'input.txt'),
+                        help='CPU instructions (default: input.txt)')
+    parser.add_argument('--width', type=int, help='render only the image on a CRT with this many pixels per row')
+    parser.add_argument('--height', type=int, default=6, help='number of CRT rows when rendering (default: 6)')
+    args = parser.parse_args()
 
+    with open(args.input) as f:
+        parsed = parse(f.read())
 
-# Common
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-instructions: deque[str] = deque(open(input_file).read().splitlines())
-signal = determine_signal(instructions)
+    # Render a custom display, writing the frame at once
+    if args.width:
+        sys.stdout.buffer.write(render_crt(parsed, args.width, args.height) + b'\n')
+        sys.exit()
 
-# Part 1
-signal_strengths = [get_signal_strength(signal, c) for c in range(20, 221, 40)]
-print(f'Part 1: {sum(signal_strengths)}')
+    print(f'Part 1: {part1(parsed)}')
+    print(f'Part 2:{part2(parsed)}')
 
-# Part 2
-print(f'Part 2:')
-render_CRT(signal)
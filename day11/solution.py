@@ -115,8 +115,10 @@ class Monkey:
         # Modify the worry level
         worry_level = self._items.popleft()
         constant = self._constant if isinstance(self._constant, int) else worry_level
-        worry_level = self._operator(worry_level, constant) % self._modulo_optimizer
-        worry_level = worry_level // self._divider % self._modulo_optimizer
+        worry_level = self._operator(worry_level, constant)
+
+        # Relieve worry, only without relief can it be kept small modulo the product of all test moduli
+        worry_level = worry_level // self._divider if self._divider != 1 else worry_level % self._modulo_optimizer
 
         # Worry level meets test condition
         if worry_level % self._modulo == 0:
@@ -171,18 +173,17 @@ def assign_monkey_relationships(_monkeys: list[tuple[Monkey, int, int]]) -> list
     return monkey_list
 
 
-def setup_game(part: int) -> list[Monkey]:
+def setup_game(monkey_notes: list[str], part: int) -> list[Monkey]:
     """
     Set up the game for part 1 or part 2.
+    :param monkey_notes: The string representations of the monkeys.
     :param part: The part number of the game.
     :return: The list of monkeys in the game.
     """
     divider: int = 3 if part == 1 else 1
 
     # Parse the monkeys and assign their relationships
-    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-    _monkeys: list[str] = open(input_file).read().split('\n\n')
-    _monkeys: list[tuple[Monkey, int, int]] = [parse_monkey(monkey, divider) for monkey in _monkeys]
+    _monkeys: list[tuple[Monkey, int, int]] = [parse_monkey(monkey, divider) for monkey in monkey_notes]
     _monkeys: list[Monkey] = assign_monkey_relationships(_monkeys)
 
     # Set the modulo optimizer for the monkeys
@@ -207,13 +208,44 @@ def perform_rounds(_monkeys: list[Monkey], rounds: int) -> None:
                 monkey.inspect_item()
 
 
-monkeys: list[Monkey] = setup_game(1)
-perform_rounds(monkeys, 20)
-top1_monkey, top2_monkey = sorted([monkey.inspect_count for monkey in monkeys])[::-1][:2]
-print(f'part1: {top1_monkey * top2_monkey}')
+def parse(text: str) -> list[str]:
+    """
+    Parse the input into the notes per monkey.
+    The monkeys themselves are set up per part, as playing the game mutates them.
+    :param text: The raw puzzle input.
+    :return: The string representations of the monkeys.
+    """
+    return text.split('\n\n')
+
+
+def part1(monkey_notes: list[str]) -> int:
+    """
+    Compute the level of monkey business after 20 rounds.
+    :param monkey_notes: The string representations of the monkeys.
+    :return: The level of monkey business.
+    """
+    monkeys: list[Monkey] = setup_game(monkey_notes, 1)
+    perform_rounds(monkeys, 20)
+    top1_monkey, top2_monkey = sorted([monkey.inspect_count for monkey in monkeys])[::-1][:2]
+    return top1_monkey * top2_monkey
+
 
+def part2(monkey_notes: list[str]) -> int:
+    """
+    Compute the level of monkey business after 10000 rounds, without worry relief.
+    :param monkey_notes: The string representations of the monkeys.
+    :return: The level of monkey business.
+    """
+    monkeys: list[Monkey] = setup_game(monkey_notes, 2)
+    perform_rounds(monkeys, 10000)
+    top1_monkey, top2_monkey = sorted([monkey.inspect_count for monkey in monkeys])[::-1][:2]
+    return top1_monkey * top2_monkey
+
+
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-monkeys: list[Monkey] = setup_game(2)
-perform_rounds(monkeys, 10000)
-top1_monkey, top2_monkey = sorted([monkey.inspect_count for monkey in monkeys])[::-1][:2]
-print(f'part2: {top1_monkey * top2_monkey}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
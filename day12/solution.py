@@ -5,11 +5,6 @@ import os
 
 from collections import deque
 
-
-# Read input for problem
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-split_input = open(input_file).read().splitlines()
-
 # Constants used in solution
 MARKER_START: str = 'S'
 MARKER_GOAL: str = 'E'
@@ -90,6 +85,38 @@ def least_steps_to_goal(height_map: list[str], reverse: bool = False) -> int:
     raise Exception('No path to goal found, BFS queue is empty.')
 
 
-print(f'part1: {least_steps_to_goal(split_input)}')
-split_input = [line.replace('a', 'S') for line in split_input]
-print(f'part2: {least_steps_to_goal(split_input, reverse=True)}')
+def parse(text: str) -> list[str]:
+    """
+    Parse the input into the height map.
+    :param text: The raw puzzle input.
+    :return: The height map of the environment.
+    """
+    return text.splitlines()
+
+
+def part1(height_map: list[str]) -> int:
+    """
+    Find the least amount of steps from the start position to the goal.
+    :param height_map: The height map of the environment.
+    :return: The least amount of steps needed.
+    """
+    return least_steps_to_goal(height_map)
+
+
+def part2(height_map: list[str]) -> int:
+    """
+    Find the least amount of steps from any lowest position to the goal.
+    :param height_map: The height map of the environment.
+    :return: The least amount of steps needed.
+    """
+    height_map = [line.replace('a', 'S') for line in height_map]
+    return least_steps_to_goal(height_map, reverse=True)
+
+
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
+
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
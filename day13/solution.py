@@ -97,27 +97,51 @@ def are_ordered_correctly(packet_pair: PacketPair, idx: int = 0) -> bool | None:
     return current or (current is None and are_ordered_correctly(packet_pair, idx + 1))
 
 
-# Read input for problem
-input_file: str = os.path.join(os.path.dirname(__file__), 'input.txt')
-pairs: list[str] = open(input_file).read().split('\n\n')
-packet_pairs: list[PacketPair] = [parse_packet_pair(pair.splitlines()) for pair in pairs]
+def parse(text: str) -> list[PacketPair]:
+    """
+    Parse the input into packet pairs.
+    :param text: The raw puzzle input.
+    :return: The packet pairs.
+    """
+    pairs: list[str] = text.split('\n\n')
+    return [parse_packet_pair(pair.splitlines()) for pair in pairs]
+
 
-# Find pairs in right order
-pairs_in_right_order: list[int] = [i + 1 for i, packet_pair in enumerate(packet_pairs)
-                                   if are_ordered_correctly(packet_pair)]
+def part1(packet_pairs: list[PacketPair]) -> int:
+    """
+    Sum the indices of the packet pairs that are in the right order.
+    :param packet_pairs: The packet pairs.
+    :return: The sum of the indices.
+    """
+    # Find pairs in right order
+    pairs_in_right_order: list[int] = [i + 1 for i, packet_pair in enumerate(packet_pairs)
+                                       if are_ordered_correctly(packet_pair)]
+    return sum(pairs_in_right_order)
+
+
+def part2(packet_pairs: list[PacketPair]) -> int:
+    """
+    Compute the decoder key of the sorted packets, including the divider packets.
+    :param packet_pairs: The packet pairs.
+    :return: The decoder key.
+    """
+    # Flatten packet pairs and introduce divider packets
+    packets: list[Packet] = list(chain.from_iterable(packet_pairs))
+    packets.extend([[[2]], [[6]]])
 
-print(f'part1: {sum(pairs_in_right_order)}')
+    # Sort packets
+    packets = quick_sort(packets)
 
-# Flatten packet pairs and introduce divider packets
-packets: list[Packet] = list(chain.from_iterable(packet_pairs))
-packets.extend([[[2]], [[6]]])
+    # Find divider packets and compute decoder key
+    idx_divider_1 = packets.index([[2]]) + 1
+    idx_divider_2 = packets.index([[6]]) + 1
+    return idx_divider_1 * idx_divider_2
 
-# Sort packets
-packets = quick_sort(packets)
 
-# Find divider packets and compute decoder key
-idx_divider_1 = packets.index([[2]]) + 1
-idx_divider_2 = packets.index([[6]]) + 1
-decoder_key = idx_divider_1 * idx_divider_2
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-print(f'part2: {decoder_key}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
@@ -7,11 +7,6 @@ from functools import reduce
 from itertools import count
 from operator import ior
 
-
-# Read input for problem
-input_file: str = os.path.join(os.path.dirname(__file__), 'input.txt')
-lines: list[str] = open(input_file).read().splitlines()
-
 # Add easier type support for points and paths
 Point = tuple[int, int]
 Path = set[Point]
@@ -116,8 +111,39 @@ def units_before_end(solid_points: Path, part: int = 1) -> int:
             break
 
 
-paths: Path = reduce(ior, [parse_path(line) for line in lines])
-print(f'part1: {units_before_end(paths)}')
+def parse(text: str) -> Path:
+    """
+    Parse the input into the combined set of solid points.
+    :param text: The raw puzzle input.
+    :return: All points on the paths.
+    """
+    return reduce(ior, [parse_path(line) for line in text.splitlines()])
+
+
+def part1(paths: Path) -> int:
+    """
+    Count the sand units that come to rest before sand flows into the abyss.
+    :param paths: All points on the paths.
+    :return: The number of sand units.
+    """
+    # Simulation adds settled sand to the solid points, work on a copy
+    return units_before_end(set(paths))
+
+
+def part2(paths: Path) -> int:
+    """
+    Count the sand units that come to rest before the source of the sand is blocked.
+    :param paths: All points on the paths.
+    :return: The number of sand units.
+    """
+    # Simulation adds settled sand to the solid points, work on a copy
+    return units_before_end(set(paths), part=2)
+
+
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-paths: Path = reduce(ior, [parse_path(line) for line in lines])
-print(f'part2: {units_before_end(paths, part=2)}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
@@ -3,8 +3,12 @@ Advent of Code 2022: day 2
 """
 import os
 
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-split_input = open(input_file).read().splitlines()
+import numpy as np
+
+
+# The parse function takes the raw input bytes, so the runner need not decode the input
+RAW_INPUT: bool = True
+
 
 states: dict = {  # Win, draw, loss based on pick
     'AX': 3,
@@ -22,12 +26,6 @@ points: dict = {  # Base points for selection
     'Y': 2,
     'Z': 3,
 }
-solution = sum([                                      # Compute total score of rounds
-    states[round[0] + round[-1]] + points[round[-1]]  # Determine round count
-    for round in split_input                          # Split into rounds
-])
-print(f'part1: {solution}')
-
 points_pt2: dict = {  # Points for win, draw, loss
     'X': 0,
     'Y': 3,
@@ -44,8 +42,85 @@ pick_pt2: dict = {  # Base points based on win, draw, loss
     'CY': 3,
     'CZ': 1,
 }
-solution = sum([                                             # Compute total score of rounds
-    pick_pt2[round[0] + round[-1]] + points_pt2[round[-1]]   # Determine round count
-    for round in split_input                                 # Split into rounds
+
+# Round scores as lookup tables, indexed by [opponent, second column]
+scores: np.ndarray = np.array([
+    [states[opponent + response] + points[response] for response in 'XYZ']
+    for opponent in 'ABC'
 ])
-print(f'part2: {solution}')
+scores_pt2: np.ndarray = np.array([
+    [pick_pt2[opponent + outcome] + points_pt2[outcome] for outcome in 'XYZ']
+    for opponent in 'ABC'
+])
+
+
+def count_rounds(data: bytes | memoryview) -> np.ndarray:
+    """
+    Count how often each combination of columns occurs, directly on the raw bytes.
+    Every round is a fixed-width line 'A X', ending with either LF or CRLF, so both columns are strided views on
+    the input.
+    :param data: The raw strategy guide.
+    :return: The number of rounds, indexed by [opponent, second column].
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+
+    # Ignore trailing whitespace, the last line need not end with a newline
+    end = len(raw)
+    while end > 0 and raw[end-1] in b' \r\n':
+        end -= 1
+    raw = raw[:end]
+    if end == 0:
+        return np.zeros((3, 3), dtype=np.int64)
+
+    # Every line should be a round followed by the line ending, the last line only lacks its line ending
+    line_ending = b'\r\n' if len(raw) > 3 and raw[3] == ord('\r') else b'\n'
+    line_len = 3 + len(line_ending)
+    n_rounds = (len(raw) + len(line_ending)) // line_len
+    if n_rounds * line_len - len(line_ending) != len(raw) \
+            or not (raw[1::line_len] == ord(' ')).all() \
+            or not all([(raw[3+i::line_len] == byte).all() for i, byte in enumerate(line_ending)]):
+        raise ValueError("strategy guide lines should all be of the form 'A X'")
+
+    # Both columns as numbers 0-2, combined into a single index 0-8
+    opponent = raw[0::line_len] - ord('A')
+    second = raw[2::line_len] - ord('X')
+    if (opponent > 2).any() or (second > 2).any():
+        raise ValueError('strategy guide columns should be A-C and X-Z')
+
+    return np.bincount(opponent * 3 + second, minlength=9).reshape(3, 3)
+
+
+def parse(text: str | bytes | memoryview) -> np.ndarray:
+    """
+    Parse the input into the number of occurrences of each round.
+    :param text: The raw puzzle input, either decoded or as raw bytes.
+    :return: The number of rounds, indexed by [opponent, second column].
+    """
+    return count_rounds(text.encode() if isinstance(text, str) else text)
+
+
+def part1(round_counts: np.ndarray) -> int:
+    """
+    Compute the total score when the second column is the response to play.
+    :param round_counts: The number of rounds, indexed by [opponent, second column].
+    :return: The total score.
+    """
+    return int((round_counts * scores).sum())
+
+
+def part2(round_counts: np.ndarray) -> int:
+    """
+    Compute the total score when the second column is the desired outcome.
+    :param round_counts: The number of rounds, indexed by [opponent, second column].
+    :return: The total score.
+    """
+    return int((round_counts * scores_pt2).sum())
+
+
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
+
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
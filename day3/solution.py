@@ -2,12 +2,11 @@
 Advent of Code 2022: day 3
 """
 import os
+import string
 
-from more_itertools import chunked
-
-
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-split_input = open(input_file).read().splitlines()
+from functools import reduce
+from operator import and_, or_
+from typing import Iterable
 
 
 def type_to_priority(_type: str) -> int:
@@ -63,15 +62,85 @@ def get_common_type(rucksacks: list[str]) -> str:
     return list(set(x) & set(y) & set(z))[0]
 
 
-solution = sum([
-    type_to_priority(get_duplicate_type(rucksack))
-    for rucksack in split_input
-])
-print(f'part1: {solution}')
+# Bit of each type in a type mask, a type with priority p is stored at bit p - 1
+type_bits: dict[str, int] = {
+    _type: 1 << (type_to_priority(_type) - 1)
+    for _type in string.ascii_letters
+}
+
+
+def types_to_mask(types: str) -> int:
+    """
+    Represent the types in a compartment or rucksack as a 52-bit mask of priorities.
+    :param types: The types, as a string of characters.
+    :return: The mask with the bit of each present type set.
+    """
+    # OR the bit of every type directly, without building a container per compartment
+    return reduce(or_, map(type_bits.__getitem__, types), 0)
+
+
+def mask_to_priority(mask: int) -> int:
+    """
+    Determines the priority of the highest type present in a mask.
+    :param mask: The type mask.
+    :return: The priority of the type, 0 for an empty mask.
+    """
+    return mask.bit_length()
+
+
+def split_rucksack_masks(rucksack: str) -> tuple[int, int]:
+    """
+    Represent both compartments of a rucksack as type masks.
+    :param rucksack: The rucksack string representation.
+    :return: The type masks of the two compartments.
+    """
+    x, y = split_rucksack(rucksack)
+    return types_to_mask(x), types_to_mask(y)
+
+
+def sum_group_priorities(masks: Iterable[int], group_size: int = 3) -> int:
+    """
+    Sum the priorities of the type common to each group of consecutive rucksacks.
+    :param masks: The type masks of the rucksacks.
+    :param group_size: The number of rucksacks per group, an incomplete last group is ignored.
+    :return: The sum of priorities.
+    """
+    # Repeating a single iterator makes zip take consecutive rucksacks
+    groups = zip(*[iter(masks)] * group_size)
+    return sum([mask_to_priority(reduce(and_, group)) for group in groups])
+
+
+def parse(text: str) -> list[tuple[int, int]]:
+    """
+    Parse the input into the type masks of the compartments of each rucksack.
+    :param text: The raw puzzle input.
+    :return: The type masks of both compartments per rucksack.
+    """
+    return [split_rucksack_masks(rucksack) for rucksack in text.splitlines()]
+
+
+def part1(compartments: list[tuple[int, int]]) -> int:
+    """
+    Sum the priorities of the types present in both compartments of each rucksack.
+    :param compartments: The type masks of both compartments per rucksack.
+    :return: The sum of priorities.
+    """
+    return sum([mask_to_priority(x & y) for x, y in compartments])
+
+
+def part2(compartments: list[tuple[int, int]]) -> int:
+    """
+    Sum the priorities of the badge types of each group of three elves.
+    :param compartments: The type masks of both compartments per rucksack.
+    :return: The sum of priorities.
+    """
+    return sum_group_priorities([x | y for x, y in compartments], 3)
+
 
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-solution = sum([
-    type_to_priority(get_common_type(rucksacks))
-    for rucksacks in chunked(split_input, 3)
-])
-print(f'part2: {solution}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
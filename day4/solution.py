@@ -3,8 +3,15 @@ Advent of Code 2022: day 4
 """
 import os
 
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-split_input = open(input_file).read().splitlines()
+import numpy as np
+
+
+# The parse function takes the raw input bytes, so the runner need not decode the input
+RAW_INPUT: bool = True
+
+
+# Translation replacing the range separators by whitespace, leaving only numbers
+separators: bytes = bytes.maketrans(b',-', b'  ')
 
 
 def get_min_max_ranges(line: str) -> tuple[int, int, int, int]:
@@ -24,9 +31,20 @@ def get_min_max_ranges(line: str) -> tuple[int, int, int, int]:
     return int(r1_min), int(r1_max), int(r2_min), int(r2_max)
 
 
-def is_fully_contained(r1_min: int, r1_max: int, r2_min: int, r2_max: int) -> bool:
+def parse_ranges(data: bytes) -> np.ndarray:
+    """
+    Get the min and max of the ranges of all pairs at once.
+    :param data: The lines containing both ranges, as raw bytes.
+    :return: The minimum and maximum of the first and second range, one row per pair.
+    """
+    return np.fromstring(data.translate(separators), dtype=np.int64, sep=' ').reshape(-1, 4)
+
+
+def is_fully_contained(r1_min: int | np.ndarray, r1_max: int | np.ndarray,
+                       r2_min: int | np.ndarray, r2_max: int | np.ndarray) -> bool | np.ndarray:
     """
     Check if the second range is fully contained within the first.
+    Also works element-wise on arrays of ranges.
     :param r1_min: The minimum of the first range.
     :param r1_max: The maximum of the first range.
     :param r2_min: The minimum of the second range.
@@ -34,12 +52,14 @@ def is_fully_contained(r1_min: int, r1_max: int, r2_min: int, r2_max: int) -> bo
     :return: True if the second range is fully contained within the first.
     """
     # Check if one range is fully contained within the other.
-    return (r1_min <= r2_min and r2_max <= r1_max) or (r2_min <= r1_min and r1_max <= r2_max)
+    return ((r1_min <= r2_min) & (r2_max <= r1_max)) | ((r2_min <= r1_min) & (r1_max <= r2_max))
 
 
-def overlaps(r1_min: int, r1_max: int, r2_min: int, r2_max: int) -> bool:
+def overlaps(r1_min: int | np.ndarray, r1_max: int | np.ndarray,
+             r2_min: int | np.ndarray, r2_max: int | np.ndarray) -> bool | np.ndarray:
     """
     Check if the two ranges overlap.
+    Also works element-wise on arrays of ranges.
     :param r1_min: The minimum of the first range.
     :param r1_max: The maximum of the first range.
     :param r2_min: The minimum of the second range.
@@ -47,12 +67,88 @@ def overlaps(r1_min: int, r1_max: int, r2_min: int, r2_max: int) -> bool:
     :return: True if the two ranges overlap.
     """
     # Check if the two ranges overlap.
-    return (r1_min <= r2_min <= r1_max) or (r2_min <= r1_min <= r2_max)
+    return (r1_min <= r2_max) & (r2_min <= r1_max)
+
+
+class IntervalIndex:
+    """Interval index, answers queries over the section ranges of all elves in the input."""
+    def __init__(self, ranges: np.ndarray) -> None:
+        """
+        Initialize an interval index, sorting the start and end sections of all ranges.
+        :param ranges: The minimum and maximum of the first and second range, one row per pair.
+        """
+        self._starts: np.ndarray = np.sort(ranges[:, [0, 2]], axis=None)
+        self._ends: np.ndarray = np.sort(ranges[:, [1, 3]], axis=None)
+
+        # Pairs of ranges that do not overlap: the other range starts after this one ends
+        non_overlapping = (len(self._starts) - np.searchsorted(self._starts, self._ends, side='right')).sum()
+        self._overlapping_pairs: int = len(self) * (len(self) - 1) // 2 - int(non_overlapping)
+
+    def __len__(self) -> int:
+        """Get the number of ranges in the index."""
+        return len(self._starts)
+
+    def coverage(self, section: int | np.ndarray) -> int | np.ndarray:
+        """
+        Count the ranges that cover a section.
+        :param section: The section, or an array of sections.
+        :return: The number of ranges containing the section.
+        """
+        # Ranges started at or before the section, minus those that already ended before it
+        return (np.searchsorted(self._starts, section, side='right')
+                - np.searchsorted(self._ends, section, side='left'))
 
+    def count_overlapping(self, section_min: int, section_max: int) -> int:
+        """
+        Count the ranges that overlap with a range of sections.
+        :param section_min: The minimum of the range.
+        :param section_max: The maximum of the range.
+        :return: The number of ranges sharing at least one section with the range.
+        """
+        # All ranges, except those ending before or starting after the range
+        ended_before = np.searchsorted(self._ends, section_min, side='left')
+        started_after = len(self) - np.searchsorted(self._starts, section_max, side='right')
+        return int(len(self) - ended_before - started_after)
+
+    def count_overlapping_pairs(self) -> int:
+        """
+        Count the pairs of ranges anywhere in the input that overlap, including the pairs of a single line.
+        :return: The number of overlapping pairs of ranges.
+        """
+        return self._overlapping_pairs
+
+
+def parse(text: str | bytes | memoryview) -> np.ndarray:
+    """
+    Parse the input into the section assignment ranges of each pair.
+    :param text: The raw puzzle input, either decoded or as raw bytes.
+    :return: The minimum and maximum of the first and second range, one row per pair.
+    """
+    return parse_ranges(text.encode() if isinstance(text, str) else bytes(text))
+
+
+def part1(ranges: np.ndarray) -> int:
+    """
+    Count the pairs where one range fully contains the other.
+    :param ranges: The ranges, one row per pair.
+    :return: The number of fully contained pairs.
+    """
+    return int(np.count_nonzero(is_fully_contained(*ranges.T)))
+
+
+def part2(ranges: np.ndarray) -> int:
+    """
+    Count the pairs where the ranges overlap.
+    :param ranges: The ranges, one row per pair.
+    :return: The number of overlapping pairs.
+    """
+    return int(np.count_nonzero(overlaps(*ranges.T)))
 
-solution = sum([int(is_fully_contained(*get_min_max_ranges(line))) for line in split_input])
-print(f'part1: {solution}')
 
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-solution = sum([int(overlaps(*get_min_max_ranges(line))) for line in split_input])
-print(f'part2: {solution}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
@@ -4,24 +4,17 @@ Advent of Code 2022: day 5
 import os
 import re
 
-from collections import deque
 
-
-# Read in input
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-starting_stacks, procedure = open(input_file).read().split('\n\n')
-steps = procedure.splitlines()
-
-
-def parse_starting_stacks(_starting_stacks: str) -> list[deque]:
+def parse_starting_stacks(_starting_stacks: str) -> list[list[str]]:
     """
     Parse the starting stack states.
+    Stacks are lists with their top crate last, so crates can be moved in bulk with slices.
     :param _starting_stacks: The starting representation.
     :return: A list of stacks.
     """
     lines = _starting_stacks.split('\n')
     n_stacks = int(_starting_stacks[-1].split(' ')[-1])
-    _stacks = [deque() for _ in range(n_stacks)]
+    _stacks: list[list[str]] = [[] for _ in range(n_stacks)]
 
     # Parse lines possibly containing stacks
     for line in lines[::-1][1:]:
@@ -56,19 +49,27 @@ def parse_step(step: str) -> tuple[int, int, int]:
     return int(x), int(y), int(z)
 
 
-def perform_steps_one_by_one(_stacks: list[deque], n: int, from_stack: int, to_stack: int) -> None:
+def perform_steps_one_by_one(_stacks: list[list[str]], n: int, from_stack: int, to_stack: int) -> None:
     """
     Perform a single step of the procedure, while moving crates one by one.
+    Moving crates one by one reverses their order, so the moved slice is added reversed.
     :param _stacks: The current stack states.
     :param n: The number of crates to move.
     :param from_stack: The stack to move crates from.
     :param to_stack: The stack to move crates to.
     :return: The new stack states.
     """
-    [_stacks[to_stack-1].append(_stacks[from_stack-1].pop()) for _ in range(n)]
+    source = _stacks[from_stack-1]
+    if n > len(source):
+        raise IndexError(f'cannot move {n} crates from stack {from_stack} holding {len(source)}')
+
+    split_idx = len(source) - n
+    crates_to_move = source[split_idx:]
+    del source[split_idx:]
+    _stacks[to_stack-1].extend(reversed(crates_to_move))
 
 
-def perform_steps(_stacks: list[deque], n: int, from_stack: int, to_stack: int) -> None:
+def perform_steps(_stacks: list[list[str]], n: int, from_stack: int, to_stack: int) -> None:
     """
     Perform a single step of the procedure, while moving multiple crates at once.
     :param _stacks: The current stack states.
@@ -77,17 +78,104 @@ def perform_steps(_stacks: list[deque], n: int, from_stack: int, to_stack: int)
     :param to_stack: The stack to move crates to.
     :return: The new stack states.
     """
-    crates_to_move = [_stacks[from_stack-1].pop() for _ in range(n)]
-    _stacks[to_stack-1].extend(crates_to_move[::-1])
+    source = _stacks[from_stack-1]
+    if n > len(source):
+        raise IndexError(f'cannot move {n} crates from stack {from_stack} holding {len(source)}')
+
+    split_idx = len(source) - n
+    crates_to_move = source[split_idx:]
+    del source[split_idx:]
+    _stacks[to_stack-1].extend(crates_to_move)
+
+
+def top_crates_by_tracing(_starting_stacks: str, steps: list[tuple[int, int, int]], one_by_one: bool) -> str:
+    """
+    Get the top crate of each stack after the procedure, without simulating the stacks.
+    Only the stack heights are followed forward; then the final top positions are traced back through the
+    steps to their starting positions, which are looked up directly in the starting representation.
+    :param _starting_stacks: The starting representation.
+    :param steps: The parsed steps of the procedure.
+    :param one_by_one: Whether crates are moved one by one (CrateMover 9000) or at once (CrateMover 9001).
+    :return: The top crate of each stack, empty stacks are skipped.
+    """
+    lines = _starting_stacks.split('\n')[:-1]
+    n_stacks = int(_starting_stacks[-1].split(' ')[-1])
+
+    # Row of the top crate of each starting stack, crates are stacked without gaps
+    top_rows: list[int] = []
+    for i in range(n_stacks):
+        char_idx = 1 + i*4
+        top_rows.append(next((r for r, line in enumerate(lines) if len(line) > char_idx and line[char_idx] != ' '),
+                             len(lines)))
+
+    # Follow the heights only
+    heights = [len(lines) - top_row for top_row in top_rows]
+    for n, from_stack, to_stack in steps:
+        heights[from_stack-1] -= n
+        heights[to_stack-1] += n
+
+    # Positions as (stack, depth below the top), starting at the final top of each stack
+    positions = [[i, 0] for i in range(n_stacks) if heights[i] > 0]
+    for n, from_stack, to_stack in reversed(steps):
+        from_stack, to_stack = from_stack - 1, to_stack - 1
+        for position in positions:
+            stack, depth = position
+
+            # Crate was moved in this step
+            if stack == to_stack and depth < n:
+                position[0] = from_stack
+                position[1] = n - 1 - depth if one_by_one else depth
 
+            # Crate was below the moved crates
+            elif stack == to_stack:
+                position[1] = depth - n
+
+            # Crate was covered by the moved crates
+            elif stack == from_stack:
+                position[1] = depth + n
+
+    return ''.join([lines[top_rows[stack] + depth][1 + stack*4] for stack, depth in positions])
+
+
+def parse(text: str) -> tuple[str, list[tuple[int, int, int]]]:
+    """
+    Parse the input into the starting stacks and the steps of the procedure.
+    The starting stacks are kept in their textual form, as performing steps mutates them.
+    :param text: The raw puzzle input.
+    :return: The starting stack representation and the parsed steps.
+    """
+    starting_stacks, procedure = text.split('\n\n')
+    return starting_stacks, [parse_step(step) for step in procedure.splitlines()]
+
+
+def part1(parsed: tuple[str, list[tuple[int, int, int]]]) -> str:
+    """
+    Get the top crates after moving crates one by one.
+    :param parsed: The starting stack representation and the parsed steps.
+    :return: The top crate of each stack.
+    """
+    starting_stacks, steps = parsed
+    stacks = parse_starting_stacks(starting_stacks)
+    [perform_steps_one_by_one(stacks, *step) for step in steps]
+    return ''.join([stack[-1] for stack in stacks])
+
+
+def part2(parsed: tuple[str, list[tuple[int, int, int]]]) -> str:
+    """
+    Get the top crates after moving multiple crates at once.
+    :param parsed: The starting stack representation and the parsed steps.
+    :return: The top crate of each stack.
+    """
+    starting_stacks, steps = parsed
+    stacks = parse_starting_stacks(starting_stacks)
+    [perform_steps(stacks, *step) for step in steps]
+    return ''.join([stack[-1] for stack in stacks])
 
-stacks = parse_starting_stacks(starting_stacks)
-[perform_steps_one_by_one(stacks, *parse_step(step)) for step in steps]
-solution = ''.join([stack[-1] for stack in stacks])
-print(f'part1: {solution}')
 
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-stacks = parse_starting_stacks(starting_stacks)
-[perform_steps(stacks, *parse_step(step)) for step in steps]
-solution = ''.join([stack[-1] for stack in stacks])
-print(f'part2: {solution}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
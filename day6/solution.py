@@ -1,13 +1,25 @@
 """
 Advent of Code 2022: day 6
 """
+import argparse
+import mmap
+import multiprocessing
 import os
+import sys
+import time
 
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator
 
 
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-signal = open(input_file).read()
+# The parse function takes the raw input bytes, so the runner need not decode the input
+RAW_INPUT: bool = True
+
+
+# Index of the earliest chunk a marker was found in, shared with the worker processes
+earliest_hit: multiprocessing.Value = None
 
 
 def get_start_marker_index(_signal: str, marker_len: int = 4) -> int:
@@ -31,9 +43,181 @@ def get_start_marker_index(_signal: str, marker_len: int = 4) -> int:
         history.append(char)
 
 
-solution = get_start_marker_index(signal)
-print(f'part1: {solution}')
+def find_start_markers(chunks: Iterable[bytes], marker_lens: Iterable[int] = (4, 14)) -> dict[int, int | None]:
+    """
+    Get the indices of the markers of several lengths in a single pass over the signal.
+    Tracks the longest run of distinct characters ending at the current character, using the last index each
+    byte was seen at, so every character is processed in constant time regardless of the marker lengths.
+    :param chunks: The received signal as consecutive chunks of bytes, e.g. blocks read from a file.
+    :param marker_lens: The lengths of the markers to detect.
+    :return: The index of the start of the signal per marker length, None if the marker was not found.
+    """
+    pending = sorted(set(marker_lens))
+    markers: dict[int, int | None] = dict.fromkeys(pending)
+    last_seen = [-1] * 256
+    run_start = 0
+    offset = 0
+
+    for chunk in chunks:
+        for i, byte in enumerate(chunk, offset):
+            # End of the signal
+            if byte == ord('\n'):
+                return markers
+
+            # Character repeats within the run, the run restarts right after its previous occurrence
+            if last_seen[byte] >= run_start:
+                run_start = last_seen[byte] + 1
+            last_seen[byte] = i
+
+            # Enough distinct characters, markers encountered
+            while pending and i - run_start + 1 >= pending[0]:
+                markers[pending.pop(0)] = i + 1
+
+            if not pending:
+                return markers
+
+        offset += len(chunk)
+
+    return markers
+
+
+def init_marker_worker(shared_earliest_hit: multiprocessing.Value) -> None:
+    """
+    Initialize a worker process of the parallel marker search.
+    :param shared_earliest_hit: The index of the earliest chunk a marker was found in.
+    """
+    global earliest_hit
+    earliest_hit = shared_earliest_hit
+
+
+def find_marker_in_chunk(input_file: str, chunk_idx: int, start: int, end: int, marker_len: int,
+                         block_size: int = 1 << 20) -> int | None:
+    """
+    Find the first marker in a chunk of a signal file, giving up once an earlier chunk contains a marker.
+    :param input_file: The path of the signal.
+    :param chunk_idx: The index of the chunk.
+    :param start: The index of the first byte of the chunk.
+    :param end: The index after the last byte of the chunk.
+    :param marker_len: The length of the marker to detect.
+    :param block_size: The number of bytes to search between checks for an earlier marker.
+    :return: The index of the start of the signal, None if not found or given up.
+    """
+    with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        def _blocks() -> Iterator[bytes]:
+            """Read the chunk block by block, stopping early when an earlier chunk has a marker."""
+            for block_start in range(start, end, block_size):
+                if earliest_hit.value < chunk_idx:
+                    return
+                yield data[block_start:min(end, block_start + block_size)]
+
+        marker = find_start_markers(_blocks(), (marker_len,))[marker_len]
+
+    # Let workers on later chunks give up
+    if marker is not None:
+        with earliest_hit.get_lock():
+            earliest_hit.value = min(earliest_hit.value, chunk_idx)
+        return start + marker
+
+    return None
+
+
+def find_start_marker_parallel(input_file: str, marker_len: int = 4,
+                               chunk_size: int = 1 << 24, jobs: int = None) -> int | None:
+    """
+    Get the index of the start of a signal file, searching chunks of it in worker processes.
+    Consecutive chunks overlap by marker_len - 1 bytes, so every marker lies entirely within one chunk, and the
+    earliest chunk containing a marker holds the global answer. Gives the same result as get_start_marker_index.
+    :param input_file: The path of the signal.
+    :param marker_len: The length of the marker to detect.
+    :param chunk_size: The number of bytes of the signal in which each chunk looks for the end of a marker.
+    :param jobs: The number of worker processes, defaults to the number of CPUs.
+    :return: The index of the start of the signal, None if not found.
+    """
+    size = os.path.getsize(input_file)
+    chunks = [(max(0, chunk_start - marker_len + 1), min(size, chunk_start + chunk_size))
+              for chunk_start in range(0, size, chunk_size)]
+
+    shared_earliest_hit = multiprocessing.Value('q', len(chunks))
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), initializer=init_marker_worker,
+                             initargs=(shared_earliest_hit,)) as executor:
+        futures = [executor.submit(find_marker_in_chunk, input_file, chunk_idx, start, end, marker_len)
+                   for chunk_idx, (start, end) in enumerate(chunks)]
+
+        # The first chunk in order with a marker has the answer, chunks after it are no longer needed
+        for chunk_idx, future in enumerate(futures):
+            marker = future.result()
+            if marker is not None:
+                [later_future.cancel() for later_future in futures[chunk_idx+1:]]
+                return marker
+
+    return None
+
+
+def parse(text: str | bytes | memoryview) -> dict[int, int | None]:
+    """
+    Parse the input, finding the start-of-packet and start-of-message markers in a single pass.
+    :param text: The raw puzzle input, either decoded or as raw bytes.
+    :return: The index of the start of the signal per marker length.
+    """
+    return find_start_markers([text.encode() if isinstance(text, str) else text], (4, 14))
+
+
+def part1(markers: dict[int, int | None]) -> int:
+    """
+    Get the index of the start-of-packet marker.
+    :param markers: The index of the start of the signal per marker length.
+    :return: The number of characters processed before the marker is complete.
+    """
+    return markers[4]
+
+
+def part2(markers: dict[int, int | None]) -> int:
+    """
+    Get the index of the start-of-message marker.
+    :param markers: The index of the start of the signal per marker length.
+    :return: The number of characters processed before the marker is complete.
+    """
+    return markers[14]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Advent of Code 2022: day 6')
+    parser.add_argument('input', nargs='?', help="signal to stream, '-' for stdin (default: input.txt)")
+    parser.add_argument('-m', '--marker-len', type=int, nargs='+', default=[4, 14],
+                        help='lengths of the markers to detect when streaming (default: 4 14)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes searching chunks of the signal (default: 1)')
+    parser.add_argument('--chunk-size', type=int, default=1 << 24,
+                        help='number of bytes per chunk of the parallel search (default: 16 MiB)')
+    parser.add_argument('--scaling', action='store_true',
+                        help='time the parallel search for 1 up to the number of CPUs worker processes')
+    args = parser.parse_args()
+
+    # Show how the parallel search scales with the number of cores
+    if args.input and args.scaling:
+        for jobs in range(1, os.cpu_count() + 1):
+            start = time.perf_counter()
+            markers = {marker_len: find_start_marker_parallel(args.input, marker_len, args.chunk_size, jobs)
+                       for marker_len in args.marker_len}
+            print(f'{jobs:>3} jobs: {time.perf_counter() - start:.3f}s {markers}')
+        sys.exit()
+
+    # Search chunks of a huge signal in parallel
+    if args.input and args.jobs > 1:
+        print({marker_len: find_start_marker_parallel(args.input, marker_len, args.chunk_size, args.jobs)
+               for marker_len in args.marker_len})
+        sys.exit()
+
+    # Stream an arbitrarily large signal in blocks
+    if args.input:
+        f = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+        with f:
+            print(find_start_markers(iter(partial(f.read, 1 << 16), b''), args.marker_len))
+        sys.exit()
 
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
 
-solution = get_start_marker_index(signal, 14)
-print(f'part2: {solution}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
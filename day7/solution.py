@@ -1,10 +1,23 @@
 """
 Advent of Code 2022: day 7
 """
+import argparse
+import hashlib
+import mmap
 import os
 import re
-import sys
+import struct
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from collections import deque
+from itertools import accumulate
+from typing import Iterable
+
+
+# Snapshot header: magic, version, transcript hash, number of directories, names and bytes in the string table
+SNAPSHOT_HEADER: struct.Struct = struct.Struct('=4sI32sQQQ')
+SNAPSHOT_MAGIC: bytes = b'AOC7'
+SNAPSHOT_VERSION: int = 1
 
 
 class File:
@@ -161,32 +174,495 @@ def parse_commands(_commands: deque[str]) -> Directory:
     return root_dir
 
 
-# Read in the system commands and parse to a directory structure
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-commands: deque[str] = deque(open(input_file).read().splitlines())
-start_dir: Directory = parse_commands(commands)
+class FileSystem:
+    """
+    Compact file system, represents all directories as parallel arrays indexed by directory id.
+    Subdirectories always get a higher id than their parent, the root directory has id 0.
+    A file system loaded from a snapshot reads the arrays straight from the mapped file, until it is modified.
+    """
+    __slots__ = ('_parents', '_own_sizes', '_name_ids', '_names', '_name_lookup', '_children',
+                 '_name_offsets', '_name_data')
+
+    def __init__(self) -> None:
+        """Initialize a file system containing only the root directory."""
+        self._parents: array = array('q', [-1])
+        self._own_sizes: array = array('q', [0])
+        self._names: list[str] = ['/']
+        self._name_lookup: dict[str, int] = {'/': 0}
+        self._name_ids: array = array('q', [0])
+        self._children: dict[tuple[int, int], int] = {}
+        self._name_offsets: memoryview | None = None
+        self._name_data: memoryview | None = None
+
+    def __len__(self) -> int:
+        """Get the number of directories."""
+        return len(self._parents)
+
+    @property
+    def parents(self) -> array:
+        """Get the parent id of each directory, -1 for the root directory."""
+        return self._parents
+
+    @property
+    def own_sizes(self) -> array:
+        """Get the size of the files directly in each directory."""
+        return self._own_sizes
+
+    def name(self, dir_id: int) -> str:
+        """
+        Get the name of a directory.
+        :param dir_id: The directory id.
+        :return: The directory name.
+        """
+        name_id = self._name_ids[dir_id]
+        if self._name_data is not None:
+            return str(self._name_data[self._name_offsets[name_id]:self._name_offsets[name_id+1]], 'utf-8')
+        return self._names[name_id]
+
+    def _make_writable(self) -> None:
+        """Copy a file system loaded from a snapshot into regular arrays and lookups, so it can be modified."""
+        if self._name_data is None:
+            return
+
+        self._parents = array('q', self._parents)
+        self._own_sizes = array('q', self._own_sizes)
+        self._name_ids = array('q', self._name_ids)
+        self._names = [str(self._name_data[start:end], 'utf-8')
+                       for start, end in zip(self._name_offsets, self._name_offsets[1:])]
+        self._name_lookup = {_name: name_id for name_id, _name in enumerate(self._names)}
+        self._children = {(parent_id, name_id): dir_id
+                          for dir_id, (parent_id, name_id) in enumerate(zip(self._parents, self._name_ids)) if dir_id}
+        self._name_offsets = self._name_data = None
+
+    def save_snapshot(self, snapshot_file: str, source_hash: bytes) -> None:
+        """
+        Write the file system to a binary snapshot: a header, the directory table as three columns of 64-bit
+        integers, the offsets of the names in the string table and the UTF-8 encoded string table.
+        :param snapshot_file: The path of the snapshot.
+        :param source_hash: The hash of the transcript the file system was parsed from.
+        """
+        self._make_writable()
+        encoded = [_name.encode() for _name in self._names]
+        name_offsets = array('q', accumulate(map(len, encoded), initial=0))
+        string_table = b''.join(encoded)
+
+        with open(snapshot_file, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, source_hash,
+                                         len(self._parents), len(self._names), len(string_table)))
+            [column.tofile(f) for column in (self._parents, self._own_sizes, self._name_ids, name_offsets)]
+            f.write(string_table)
+
+    @classmethod
+    def load_snapshot(cls, snapshot_file: str, source_hash: bytes) -> 'FileSystem | None':
+        """
+        Load a file system from a binary snapshot, mapping it into memory without creating objects per directory.
+        :param snapshot_file: The path of the snapshot.
+        :param source_hash: The hash of the transcript the file system should be parsed from.
+        :return: The file system, None if the snapshot is missing, invalid or made from another transcript.
+        """
+        if not os.path.isfile(snapshot_file) or os.path.getsize(snapshot_file) < SNAPSHOT_HEADER.size:
+            return None
+
+        with open(snapshot_file, 'rb') as f:
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        magic, version, snapshot_hash, n_dirs, n_names, n_bytes = SNAPSHOT_HEADER.unpack_from(data)
+        if (magic, version, snapshot_hash) != (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, source_hash) \
+                or len(data) != SNAPSHOT_HEADER.size + 8 * (3 * n_dirs + n_names + 1) + n_bytes:
+            return None
+
+        # Slice the columns out of the mapped file
+        file_system = cls.__new__(cls)
+        offset = SNAPSHOT_HEADER.size
+        columns = []
+        for length in (n_dirs, n_dirs, n_dirs, n_names + 1):
+            columns.append(data[offset:offset + 8 * length].cast('q'))
+            offset += 8 * length
+        file_system._parents, file_system._own_sizes, file_system._name_ids, file_system._name_offsets = columns
+        file_system._name_data = data[offset:]
+        file_system._names, file_system._name_lookup, file_system._children = [], {}, {}
+        return file_system
+
+    def get_directory(self, parent_id: int, _name: str) -> int:
+        """
+        Get a subdirectory by name, adding it if it doesn't exist yet.
+        :param parent_id: The id of the parent directory.
+        :param _name: The directory name.
+        :return: The id of the subdirectory.
+        """
+        self._make_writable()
+        name_id = self._name_lookup.setdefault(_name, len(self._names))
+        if name_id == len(self._names):
+            self._names.append(_name)
+
+        dir_id = self._children.setdefault((parent_id, name_id), len(self._parents))
+        if dir_id == len(self._parents):
+            self._parents.append(parent_id)
+            self._own_sizes.append(0)
+            self._name_ids.append(name_id)
+
+        return dir_id
+
+    def add_file(self, dir_id: int, size: int) -> None:
+        """
+        Add a file to a directory.
+        :param dir_id: The id of the directory.
+        :param size: The file size.
+        """
+        self._make_writable()
+        self._own_sizes[dir_id] += size
+
+    def remove_file(self, dir_id: int, size: int) -> None:
+        """
+        Remove a file from a directory.
+        :param dir_id: The id of the directory.
+        :param size: The file size.
+        """
+        self._make_writable()
+        self._own_sizes[dir_id] -= size
+
+    def total_sizes(self) -> array:
+        """
+        Compute the total size of each directory, including all nested subdirectories.
+        A single pass in reverse id order visits every subdirectory before its parent.
+        :return: The total size per directory id.
+        """
+        totals = array('q', self._own_sizes)
+        parents = self._parents
+        for dir_id in range(len(totals) - 1, 0, -1):
+            totals[parents[dir_id]] += totals[dir_id]
+        return totals
+
+
+class SortedSizes:
+    """
+    Sorted multiset of sizes, kept as a list of sorted buckets with Fenwick trees over the bucket counts and sums.
+    With a constant bucket size, adding and removing a size and all queries take O(log n).
+    """
+    __slots__ = ('_bucket_size', '_buckets', '_maxes', '_counts', '_sums')
+
+    def __init__(self, sizes: Iterable[int], bucket_size: int = 256) -> None:
+        """
+        Initialize a sorted multiset of sizes.
+        :param sizes: The initial sizes, in any order.
+        :param bucket_size: The number of sizes per bucket, buckets are split when they get twice as large.
+        """
+        sizes = sorted(sizes)
+        self._bucket_size: int = bucket_size
+        self._buckets: list[list[int]] = [sizes[i:i+bucket_size] for i in range(0, len(sizes), bucket_size)]
+        self._maxes: list[int] = []
+        self._counts: list[int] = []
+        self._sums: list[int] = []
+        self._rebuild()
+
+    def __len__(self) -> int:
+        """Get the number of sizes."""
+        return self._prefix(len(self._buckets))[0]
+
+    def _rebuild(self) -> None:
+        """Rebuild the bucket maxima and the Fenwick trees in linear time, after buckets were split or removed."""
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._counts = [0] + [len(bucket) for bucket in self._buckets]
+        self._sums = [0] + [sum(bucket) for bucket in self._buckets]
+
+        # Every node adds its range to the node covering it
+        for i in range(1, len(self._counts)):
+            parent = i + (i & -i)
+            if parent < len(self._counts):
+                self._counts[parent] += self._counts[i]
+                self._sums[parent] += self._sums[i]
+
+    def _update(self, bucket_idx: int, count: int, size: int) -> None:
+        """
+        Add sizes to the Fenwick trees.
+        :param bucket_idx: The index of the bucket the sizes were added to.
+        :param count: The number of sizes added, negative if removed.
+        :param size: The size added.
+        """
+        i = bucket_idx + 1
+        while i < len(self._counts):
+            self._counts[i] += count
+            self._sums[i] += count * size
+            i += i & -i
+
+    def _prefix(self, bucket_idx: int) -> tuple[int, int]:
+        """
+        Count and sum the sizes in the buckets before a bucket.
+        :param bucket_idx: The index of the bucket.
+        :return: The number of sizes and their sum.
+        """
+        count = total = 0
+        while bucket_idx > 0:
+            count += self._counts[bucket_idx]
+            total += self._sums[bucket_idx]
+            bucket_idx -= bucket_idx & -bucket_idx
+        return count, total
+
+    def add(self, size: int) -> None:
+        """
+        Add a size.
+        :param size: The size to add.
+        """
+        if not self._buckets:
+            self._buckets.append([size])
+            self._rebuild()
+            return
+
+        # Sizes larger than all others go into the last bucket
+        bucket_idx = min(bisect_left(self._maxes, size), len(self._buckets) - 1)
+        bucket = self._buckets[bucket_idx]
+        insort(bucket, size)
+        self._maxes[bucket_idx] = bucket[-1]
+        self._update(bucket_idx, 1, size)
+
+        # Split buckets that grew too large
+        if len(bucket) > 2 * self._bucket_size:
+            self._buckets[bucket_idx:bucket_idx+1] = [bucket[:self._bucket_size], bucket[self._bucket_size:]]
+            self._rebuild()
+
+    def remove(self, size: int) -> None:
+        """
+        Remove a size.
+        :param size: The size to remove.
+        """
+        bucket_idx = bisect_left(self._maxes, size)
+        bucket = self._buckets[bucket_idx] if bucket_idx < len(self._buckets) else []
+        idx = bisect_left(bucket, size)
+        if idx == len(bucket) or bucket[idx] != size:
+            raise ValueError(f'size {size} not present')
+
+        del bucket[idx]
+        if not bucket:
+            del self._buckets[bucket_idx]
+            self._rebuild()
+            return
+
+        self._maxes[bucket_idx] = bucket[-1]
+        self._update(bucket_idx, -1, size)
+
+    def count_and_sum_at_most(self, max_size: int) -> tuple[int, int]:
+        """
+        Count and sum the sizes of at most a threshold.
+        :param max_size: The maximum size.
+        :return: The number of sizes and their sum.
+        """
+        bucket_idx = bisect_right(self._maxes, max_size)
+        count, total = self._prefix(bucket_idx)
+
+        # Part of the first bucket holding larger sizes
+        if bucket_idx < len(self._buckets):
+            bucket = self._buckets[bucket_idx]
+            idx = bisect_right(bucket, max_size)
+            count, total = count + idx, total + sum(bucket[:idx])
+
+        return count, total
 
-# Setup queue and other variables
-queue: deque[Directory] = deque([start_dir])
-solution1 = 0
-solution2 = sys.maxsize
-min_dir_size = 30_000_000 - (70_000_000 - start_dir.size)
+    def smallest_at_least(self, min_size: int) -> int | None:
+        """
+        Get the smallest size of at least a threshold.
+        :param min_size: The minimum size.
+        :return: The size, None if all sizes are smaller.
+        """
+        bucket_idx = bisect_left(self._maxes, min_size)
+        if bucket_idx == len(self._buckets):
+            return None
 
-# Traverse folders and sum directory sizes under a certain size
-while len(queue) > 0:
-    curr_dir = queue.popleft()
+        bucket = self._buckets[bucket_idx]
+        return bucket[bisect_left(bucket, min_size)]
+
+
+class DirectorySizeIndex:
+    """
+    Directory size index, keeps the total directory sizes of a file system sorted to answer size queries.
+    Files added or removed through the index update the sizes of the affected directories only.
+    Directories added to the file system later are picked up on the next file added or removed through the index.
+    """
+    def __init__(self, file_system: FileSystem) -> None:
+        """
+        Initialize a directory size index.
+        :param file_system: The file system to index.
+        """
+        self._file_system: FileSystem = file_system
+        self._totals: array = file_system.total_sizes()
+        self._sorted_sizes: SortedSizes = SortedSizes(self._totals)
+
+    @property
+    def total_size(self) -> int:
+        """Get the total size of the file system."""
+        return self._totals[0]
+
+    def sum_at_most(self, max_size: int) -> int:
+        """
+        Sum the sizes of all directories with a size of at most a threshold.
+        :param max_size: The maximum directory size.
+        :return: The sum of the directory sizes.
+        """
+        return self._sorted_sizes.count_and_sum_at_most(max_size)[1]
+
+    def count_above(self, min_size: int) -> int:
+        """
+        Count the directories with a size over a threshold.
+        :param min_size: The size the directories should exceed.
+        :return: The number of directories.
+        """
+        return len(self._totals) - self._sorted_sizes.count_and_sum_at_most(min_size)[0]
+
+    def smallest_at_least(self, min_size: int) -> int | None:
+        """
+        Get the size of the smallest directory that frees up at least a number of bytes.
+        :param min_size: The number of bytes to free up.
+        :return: The directory size, None if no directory is large enough.
+        """
+        return self._sorted_sizes.smallest_at_least(min_size)
+
+    def _resize(self, dir_id: int, delta: int) -> None:
+        """
+        Change the size of a directory and all its parent directories.
+        :param dir_id: The id of the directory.
+        :param delta: The change in size.
+        """
+        parents = self._file_system.parents
+        while dir_id != -1:
+            old_size = self._totals[dir_id]
+            self._sorted_sizes.remove(old_size)
+            self._sorted_sizes.add(old_size + delta)
+            self._totals[dir_id] = old_size + delta
+            dir_id = parents[dir_id]
+
+    def _add_new_directories(self) -> None:
+        """Add the directories created in the file system since it was indexed, including the files in them."""
+        first_new = len(self._totals)
+        for _ in range(first_new, len(self._file_system)):
+            self._totals.append(0)
+            self._sorted_sizes.add(0)
+
+        own_sizes = self._file_system.own_sizes
+        [self._resize(dir_id, own_sizes[dir_id])
+         for dir_id in range(first_new, len(self._totals)) if own_sizes[dir_id]]
+
+    def add_file(self, dir_id: int, size: int) -> None:
+        """
+        Add a file to a directory and update the index.
+        :param dir_id: The id of the directory.
+        :param size: The file size.
+        """
+        self._add_new_directories()
+        self._file_system.add_file(dir_id, size)
+        self._resize(dir_id, size)
+
+    def remove_file(self, dir_id: int, size: int) -> None:
+        """
+        Remove a file from a directory and update the index.
+        :param dir_id: The id of the directory.
+        :param size: The file size.
+        """
+        self._add_new_directories()
+        self._file_system.remove_file(dir_id, size)
+        self._resize(dir_id, -size)
+
+
+def parse_transcript(lines: list[str]) -> FileSystem:
+    """
+    Parse the terminal output into a compact file system, dispatching on the first characters of each line.
+    :param lines: The lines of terminal output.
+    :return: The file system.
+    """
+    file_system = FileSystem()
+    current_dir = 0
+
+    for line in lines:
+        # Ignore empty lines
+        if not line:
+            continue
+
+        first = line[0]
+
+        # Command, only 'cd' changes state as 'ls' is followed by the listing
+        if first == '$':
+            if line[2] == 'c':
+                target = line[5:]
+                if target == '/':
+                    current_dir = 0
+                elif target == '..':
+                    current_dir = file_system.parents[current_dir]
+                else:
+                    current_dir = file_system.get_directory(current_dir, target)
+
+        # Directory listing
+        elif first == 'd':
+            file_system.get_directory(current_dir, line[4:])
+
+        # File listing
+        else:
+            file_system.add_file(current_dir, int(line[:line.index(' ')]))
+
+    return file_system
+
+
+def transcript_hash(text: str) -> bytes:
+    """
+    Hash a terminal transcript, to check whether a snapshot was made from it.
+    :param text: The terminal output.
+    :return: The SHA-256 digest.
+    """
+    return hashlib.sha256(text.encode()).digest()
+
+
+def load_file_system(text: str, snapshot_file: str) -> FileSystem:
+    """
+    Load the file system of a transcript from its snapshot, parsing the transcript and writing the snapshot
+    only if the snapshot is missing or was made from another transcript.
+    :param text: The terminal output.
+    :param snapshot_file: The path of the snapshot.
+    :return: The file system.
+    """
+    source_hash = transcript_hash(text)
+    file_system = FileSystem.load_snapshot(snapshot_file, source_hash)
+    if file_system is None:
+        file_system = parse_transcript(text.splitlines())
+        file_system.save_snapshot(snapshot_file, source_hash)
+    return file_system
+
+
+def parse(text: str) -> DirectorySizeIndex:
+    """
+    Parse the system commands into an index of the directory sizes.
+    :param text: The raw puzzle input.
+    :return: The directory size index.
+    """
+    return DirectorySizeIndex(parse_transcript(text.splitlines()))
+
+
+def part1(index: DirectorySizeIndex) -> int:
+    """
+    Sum the sizes of all directories with a size of at most 100,000.
+    :param index: The directory size index.
+    :return: The sum of the directory sizes.
+    """
+    return index.sum_at_most(100_000)
+
+
+def part2(index: DirectorySizeIndex) -> int:
+    """
+    Get the size of the smallest directory that frees up enough space for the update.
+    :param index: The directory size index.
+    :return: The size of the directory to delete.
+    """
+    min_dir_size = 30_000_000 - (70_000_000 - index.total_size)
+    return index.smallest_at_least(min_dir_size)
 
-    # Meets target size for part 1
-    if curr_dir.size <= 100_000:
-        solution1 += curr_dir.size
 
-    # Meets target size for part 2
-    if curr_dir.size >= min_dir_size:
-        solution2 = min(curr_dir.size, solution2)
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Advent of Code 2022: day 7')
+    parser.add_argument('input', nargs='?', default=os.path.join(os.path.dirname(__file__), 'input.txt'),
+                        help='terminal transcript (default: input.txt)')
+    parser.add_argument('--snapshot', help='binary snapshot of the parsed file system, reused while the '
+                                           'transcript is unchanged and rewritten otherwise')
+    args = parser.parse_args()
 
-    # Add subdirectories to queue
-    for directory in curr_dir.directories.values():
-        queue.append(directory)
+    with open(args.input) as f:
+        text = f.read()
+    parsed = DirectorySizeIndex(load_file_system(text, args.snapshot)) if args.snapshot else parse(text)
 
-print(f'part1: {solution1}')
-print(f'part2: {solution2}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
@@ -1,11 +1,23 @@
 """
 Advent of Code 2022: day 8
 """
+import argparse
 import os
+import sys
 
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-split_input = open(input_file).read().splitlines()
-rows = tuple([tuple([int(h) for h in row]) for row in split_input])
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+# The parse function takes the raw input bytes, so the runner need not decode the input
+RAW_INPUT: bool = True
+
+
+# The forest and the partial results in shared memory, attached to by the worker processes
+shared_forest: dict[str, np.ndarray] = {}
+shared_blocks: list[SharedMemory] = []
 
 
 def compute_visible_trees(_rows: tuple[tuple[int]], _visible_trees: set[str],
@@ -27,7 +39,7 @@ def compute_visible_trees(_rows: tuple[tuple[int]], _visible_trees: set[str],
             _c = len(row) - _c - 1 if reverse_dir else _c
 
             # Tree visible
-            if _r == 0 or _r == len(rows) - 1 or _c == 0 or _c == len(row) - 1 or h > max_height:
+            if _r == 0 or _r == len(_rows) - 1 or _c == 0 or _c == len(row) - 1 or h > max_height:
                 _visible_trees.add(f'{_c},{_r}') if reverse_coords else _visible_trees.add(f'{_r},{_c}')
                 max_height = h
 
@@ -36,19 +48,6 @@ def compute_visible_trees(_rows: tuple[tuple[int]], _visible_trees: set[str],
                 break
 
 
-visible_trees: set[str] = set()
-
-# Traverse horizontally
-compute_visible_trees(rows, visible_trees)
-compute_visible_trees(rows, visible_trees, reverse_dir=True)
-
-# Traverse vertically
-compute_visible_trees(tuple(zip(*rows)), visible_trees, reverse_coords=True)
-compute_visible_trees(tuple(zip(*rows)), visible_trees, reverse_coords=True, reverse_dir=True)
-
-print(f'part1: {len(visible_trees)}')
-
-
 def compute_scenic_score(_rows: tuple[tuple[int]], _r: int, _c: int, _h: int) -> int:
     """
     Compute the scenic score for a given tree with its height and coordinates.
@@ -85,9 +84,297 @@ def compute_scenic_score(_rows: tuple[tuple[int]], _r: int, _c: int, _h: int) ->
             * _compute_dir(_r + 1, len(_rows), 1, on_col=True))  # Down
 
 
-scenic_scores: list[int] = []
-for r, row in enumerate(rows):
-    for c, h in enumerate(row):
-        scenic_scores.append(compute_scenic_score(rows, r, c, h))
+def parse_grid(data: bytes | memoryview) -> np.ndarray:
+    """
+    Parse a height map directly from the raw bytes, every row being a fixed-width line of digits.
+    Lines may end with either LF or CRLF.
+    :param data: The raw height map.
+    :return: The heights, indexed by [row, column].
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+
+    # Ignore trailing whitespace, the last line need not end with a newline
+    end = len(raw)
+    while end > 0 and raw[end-1] in b' \r\n':
+        end -= 1
+    raw = raw[:end]
+
+    # Find the end of the first row, looking at a growing prefix to avoid scanning the whole map
+    prefix_len = 1 << 16
+    while (newline := bytes(raw[:prefix_len]).find(b'\n')) == -1 and prefix_len < len(raw):
+        prefix_len *= 2
+
+    # Width of the digits and the line ending, a single row has no line ending
+    if newline == -1:
+        width, line_ending = len(raw), b'\n'
+    else:
+        line_ending = b'\r\n' if newline > 0 and raw[newline-1] == ord('\r') else b'\n'
+        width = newline + 1 - len(line_ending)
+    line_len = width + len(line_ending)
+
+    # Every line should end at the same offset, the last line only lacks its line ending
+    n_rows = (len(raw) + len(line_ending)) // line_len
+    if n_rows * line_len - len(line_ending) != len(raw) \
+            or not all([(raw[width+i::line_len] == byte).all() for i, byte in enumerate(line_ending)]):
+        raise ValueError('height map rows are not all of the same width')
+
+    # View the digits of each line as a row, skipping the line endings
+    digits = np.lib.stride_tricks.as_strided(raw, shape=(n_rows, width), strides=(line_len, 1))
+    return digits - ord('0')
+
+
+def visible_from_left(heights: np.ndarray) -> np.ndarray:
+    """
+    Determine which trees are visible from the left, i.e. taller than all trees before them in their row.
+    :param heights: The heights, indexed by [row, column].
+    :return: Whether each tree is visible from the left.
+    """
+    visible = np.empty(heights.shape, dtype=bool)
+    visible[:, 0] = True
+    visible[:, 1:] = heights[:, 1:] > np.maximum.accumulate(heights, axis=1)[:, :-1]
+    return visible
+
+
+def visible_horizontally(heights: np.ndarray) -> np.ndarray:
+    """
+    Determine which trees are visible from the left or the right.
+    :param heights: The heights, indexed by [row, column].
+    :return: Whether each tree is visible from either side of its row.
+    """
+    return visible_from_left(heights) | visible_from_left(heights[:, ::-1])[:, ::-1]
+
+
+def compute_visible_mask(grid: np.ndarray, band_size: int = 1024) -> np.ndarray:
+    """
+    Determine which trees are visible from outside the grid, from any of the four directions.
+    Works on bands of rows and columns, so the memory needed besides the grid and the mask stays fixed.
+    :param grid: The heights, indexed by [row, column].
+    :param band_size: The number of rows or columns per band.
+    :return: Whether each tree is visible.
+    """
+    n_rows, n_cols = grid.shape
+    visible = np.zeros(grid.shape, dtype=bool)
+
+    # Left and right
+    for start in range(0, n_rows, band_size):
+        visible[start:start+band_size] |= visible_horizontally(grid[start:start+band_size])
+
+    # Top and bottom, as the left and right of the transposed band
+    for start in range(0, n_cols, band_size):
+        band = np.ascontiguousarray(grid[:, start:start+band_size].T)
+        visible[:, start:start+band_size] |= visible_horizontally(band).T
+
+    return visible
+
+
+def viewing_distances_from_top(heights: np.ndarray) -> np.ndarray:
+    """
+    Compute how far each tree can see to the top, i.e. the distance to the nearest tree above at least as tall.
+    This is a monotonic stack per column: as heights range from 0 to 9, the stack is fully described by the row
+    of the nearest tree of at least each height, so all columns are updated at once per row in O(rows x cols).
+    :param heights: The heights, indexed by [row, column].
+    :return: The viewing distance of each tree, the distance to the edge if nothing blocks the view.
+    """
+    n_rows, n_cols = heights.shape
+    distances = np.empty(heights.shape, dtype=np.uint16 if n_rows < 1 << 16 else np.uint32)
+
+    # Row of the nearest tree above of at least each height, the edge counting as row 0
+    nearest = np.zeros((10, n_cols), dtype=np.int32)
+    col_idx = np.arange(n_cols)
+    min_heights = np.arange(10, dtype=np.uint8)[:, None]
+
+    for r in range(n_rows):
+        row = heights[r]
+        np.subtract(r, nearest[row, col_idx], out=distances[r], casting='unsafe')
+
+        # This tree blocks the view of every tree below it that is not taller
+        np.copyto(nearest, r, where=min_heights <= row)
+
+    return distances
+
+
+def compute_viewing_distances(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute how far each tree can see in each direction.
+    The stacks run over whole rows at a time, so the horizontal directions work on the transposed grid.
+    :param grid: The heights, indexed by [row, column].
+    :return: The viewing distances to the left, right, top and bottom, indexed by [row, column].
+    """
+    transposed = np.ascontiguousarray(grid.T)
+    return (viewing_distances_from_top(transposed).T,
+            viewing_distances_from_top(transposed[::-1])[::-1].T,
+            viewing_distances_from_top(grid),
+            viewing_distances_from_top(grid[::-1])[::-1])
+
+
+def compute_scenic_scores(distances: tuple[np.ndarray, ...], start: int = 0, end: int = None) -> np.ndarray:
+    """
+    Compute the scenic score of each tree in a band of rows, the product of its viewing distances.
+    :param distances: The viewing distances in each direction, indexed by [row, column].
+    :param start: The first row of the band.
+    :param end: The row after the last row of the band, defaults to the last row.
+    :return: The scenic scores, indexed by [row, column].
+    """
+    scores = np.ones(distances[0][start:end].shape, dtype=np.uint64)
+    for direction in distances:
+        scores *= direction[start:end]
+    return scores
+
+
+def max_scenic_score(distances: tuple[np.ndarray, ...], band_size: int = 1024) -> int:
+    """
+    Get the highest scenic score, computing the scores band by band to keep the memory needed fixed.
+    :param distances: The viewing distances in each direction, indexed by [row, column].
+    :param band_size: The number of rows per band.
+    :return: The highest scenic score.
+    """
+    return max([int(compute_scenic_scores(distances, start, start + band_size).max())
+                for start in range(0, len(distances[0]), band_size)])
+
+
+def attach_shared_forest(layout: dict[str, tuple[str, tuple[int, ...], str]]) -> None:
+    """
+    Initialize a worker process of the parallel forest analysis, attaching to the arrays in shared memory.
+    :param layout: The name of the shared memory block, shape and data type per array.
+    """
+    for key, (name, shape, dtype) in layout.items():
+        block = SharedMemory(name=name)
+        shared_blocks.append(block)
+        shared_forest[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def analyze_row_band(start: int, end: int) -> None:
+    """
+    Compute the visibility from the left and right and the horizontal part of the scenic scores of a band of rows.
+    :param start: The first row of the band.
+    :param end: The row after the last row of the band.
+    """
+    band = shared_forest['grid'][start:end]
+    shared_forest['visible_horizontal'][start:end] = visible_horizontally(band)
+
+    transposed = np.ascontiguousarray(band.T)
+    left = viewing_distances_from_top(transposed).T
+    right = viewing_distances_from_top(transposed[::-1])[::-1].T
+    scores = shared_forest['scores_horizontal'][start:end]
+    np.multiply(left, right, out=scores, dtype=scores.dtype)
+
+
+def analyze_column_band(start: int, end: int) -> None:
+    """
+    Compute the visibility from the top and bottom and the vertical part of the scenic scores of a band of columns.
+    :param start: The first column of the band.
+    :param end: The column after the last column of the band.
+    """
+    band = np.ascontiguousarray(shared_forest['grid'][:, start:end])
+    shared_forest['visible_vertical'][:, start:end] = visible_horizontally(np.ascontiguousarray(band.T)).T
+
+    up = viewing_distances_from_top(band)
+    down = viewing_distances_from_top(band[::-1])[::-1]
+    scores = shared_forest['scores_vertical'][:, start:end]
+    np.multiply(up, down, out=scores, dtype=scores.dtype)
+
+
+def merge_row_band(start: int, end: int) -> tuple[int, int]:
+    """
+    Combine the horizontal and vertical partials of a band of rows.
+    :param start: The first row of the band.
+    :param end: The row after the last row of the band.
+    :return: The number of visible trees and the highest scenic score in the band.
+    """
+    visible = shared_forest['visible_horizontal'][start:end] | shared_forest['visible_vertical'][start:end]
+    scores = shared_forest['scores_horizontal'][start:end].astype(np.uint64)
+    scores *= shared_forest['scores_vertical'][start:end]
+    return int(visible.sum()), int(scores.max())
+
+
+def analyze_forest_parallel(grid: np.ndarray, jobs: int = None, band_size: int = None) -> tuple[int, int]:
+    """
+    Count the visible trees and get the highest scenic score, processing bands of the grid in worker processes.
+    Row bands handle the horizontal directions and column bands the vertical ones, all reading the forest from
+    shared memory so it is never pickled. Gives the same results as part1 and part2.
+    :param grid: The heights, indexed by [row, column].
+    :param jobs: The number of worker processes, defaults to the number of CPUs.
+    :param band_size: The number of rows or columns per band, defaults to four bands per worker process.
+    :return: The number of visible trees and the highest scenic score.
+    """
+    jobs = jobs or os.cpu_count()
+    n_rows, n_cols = grid.shape
+    band_size = band_size or max(1, -(-max(n_rows, n_cols) // (4 * jobs)))
+    row_bands = [(start, min(n_rows, start + band_size)) for start in range(0, n_rows, band_size)]
+    col_bands = [(start, min(n_cols, start + band_size)) for start in range(0, n_cols, band_size)]
+
+    # Products of two viewing distances are below 2^32 as long as lines are shorter than 2^16
+    score_dtype = np.uint32 if max(n_rows, n_cols) < 1 << 16 else np.uint64
+    dtypes = {'grid': np.uint8, 'visible_horizontal': np.bool_, 'visible_vertical': np.bool_,
+              'scores_horizontal': score_dtype, 'scores_vertical': score_dtype}
+    blocks = {key: SharedMemory(create=True, size=max(1, grid.size * np.dtype(dtype).itemsize))
+              for key, dtype in dtypes.items()}
+
+    try:
+        np.ndarray(grid.shape, dtype=np.uint8, buffer=blocks['grid'].buf)[:] = grid
+        layout = {key: (blocks[key].name, grid.shape, np.dtype(dtype).str) for key, dtype in dtypes.items()}
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=attach_shared_forest, initargs=(layout,)) as executor:
+            # Horizontal and vertical partials are written to separate arrays, so all bands can run at once
+            futures = [executor.submit(analyze_row_band, start, end) for start, end in row_bands] \
+                + [executor.submit(analyze_column_band, start, end) for start, end in col_bands]
+
+            # Re-raise any failed band, its partials were never written
+            [future.result() for future in futures]
+            partials = list(executor.map(merge_row_band, *zip(*row_bands)))
+
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    return sum([visible for visible, _ in partials]), max([score for _, score in partials])
+
+
+def parse(text: str | bytes | memoryview) -> np.ndarray:
+    """
+    Parse the input into the height map.
+    :param text: The raw puzzle input, either decoded or as raw bytes.
+    :return: The heights, indexed by [row, column].
+    """
+    return parse_grid(text.encode() if isinstance(text, str) else text)
+
+
+def part1(grid: np.ndarray) -> int:
+    """
+    Count the trees visible from outside the grid.
+    :param grid: The heights, indexed by [row, column].
+    :return: The number of visible trees.
+    """
+    return int(compute_visible_mask(grid).sum())
+
+
+def part2(grid: np.ndarray) -> int:
+    """
+    Get the highest scenic score of any tree.
+    :param grid: The heights, indexed by [row, column].
+    :return: The highest scenic score.
+    """
+    return max_scenic_score(compute_viewing_distances(grid))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Advent of Code 2022: day 8')
+    parser.add_argument('input', nargs='?', default=os.path.join(os.path.dirname(__file__), 'input.txt'),
+                        help='height map (default: input.txt)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes analyzing bands of the forest (default: 1)')
+    args = parser.parse_args()
+
+    with open(args.input, 'rb') as f:
+        parsed = parse(f.read())
+
+    # Analyze bands of a huge forest in parallel
+    if args.jobs > 1:
+        visible_trees, scenic_score = analyze_forest_parallel(parsed, args.jobs)
+        print(f'part1: {visible_trees}')
+        print(f'part2: {scenic_score}')
+        sys.exit()
 
-print(f'part2: {max(scenic_scores)}')
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
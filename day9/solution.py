@@ -3,10 +3,17 @@ Advent of Code 2022: day 9
 """
 import os
 
-input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
-split_input = open(input_file).read().splitlines()
-commands = [command.split(' ') for command in split_input]
-commands = [(x, int(y)) for x, y in commands]
+
+# Step of the head per direction
+moves: dict[str, tuple[int, int]] = {
+    'R': (1, 0),
+    'L': (-1, 0),
+    'U': (0, 1),
+    'D': (0, -1),
+}
+
+# Offset making coordinates non-negative, so a position packs into a single 64-bit integer
+PACK_OFFSET: int = 1 << 31
 
 
 def run_command(command: tuple[str, int], rope: list[tuple[int, int]],
@@ -69,5 +76,132 @@ def run_commands(_commands: list[tuple[str, int]], rope_length: int = 2) -> set[
     return visited_positions
 
 
-print(f'part1: {len(run_commands(commands))}')
-print(f'part2: {len(run_commands(commands, 10))}')
+def pack_position(x: int, y: int) -> int:
+    """
+    Pack a position into a single 64-bit integer, which takes far less memory in a set than a tuple.
+    :param x: The x coordinate, within the range of a 32-bit integer.
+    :param y: The y coordinate, within the range of a 32-bit integer.
+    :return: The packed position.
+    """
+    return (x + PACK_OFFSET) << 32 | (y + PACK_OFFSET)
+
+
+def unpack_position(packed: int) -> tuple[int, int]:
+    """
+    Unpack a position packed by pack_position.
+    :param packed: The packed position.
+    :return: The x and y coordinate.
+    """
+    return (packed >> 32) - PACK_OFFSET, (packed & 0xFFFFFFFF) - PACK_OFFSET
+
+
+def simulate_rope(_commands: list[tuple[str, int]], rope_length: int = 2) -> set[int]:
+    """
+    Runs a list of directional move commands on a rope, keeping the knot coordinates in two lists.
+    The direction is resolved once per command, and a step stops propagating at the first knot that doesn't move.
+    Gives the same positions as run_commands, packed by pack_position.
+    :param _commands: The commands to run.
+    :param rope_length: The length of the rope.
+    :return: The packed visited locations of the tail of the rope.
+    """
+    xs = [0] * rope_length
+    ys = [0] * rope_length
+    visited_positions = {pack_position(0, 0)}
+
+    for direction, distance in _commands:
+        dx, dy = moves[direction]
+
+        for _ in range(distance):
+            xs[0] += dx
+            ys[0] += dy
+
+            for i in range(1, rope_length):
+                diff_x = xs[i-1] - xs[i]
+                diff_y = ys[i-1] - ys[i]
+
+                # Knot still touches the previous knot, so the rest of the rope doesn't move either
+                if -1 <= diff_x <= 1 and -1 <= diff_y <= 1:
+                    break
+
+                # Move the knot one step towards the previous knot, diagonally if needed
+                xs[i] += (diff_x > 0) - (diff_x < 0)
+                ys[i] += (diff_y > 0) - (diff_y < 0)
+
+            # Record tail position, only when the tail moved
+            else:
+                visited_positions.add(pack_position(xs[-1], ys[-1]))
+
+    return visited_positions
+
+
+def run_commands_all_lengths(_commands: list[tuple[str, int]], max_len: int) -> dict[int, int]:
+    """
+    Count the positions visited by the tail of ropes of every length up to a maximum, in a single simulation.
+    Each knot only follows the knot before it, so knot i of the longest rope moves exactly like the tail of a rope
+    of length i + 1, and recording every knot that moves gives the tails of all shorter ropes at once.
+    :param _commands: The commands to run.
+    :param max_len: The length of the longest rope.
+    :return: The number of visited positions of the tail per rope length, from 2 up to max_len.
+    """
+    xs = [0] * max_len
+    ys = [0] * max_len
+    visited_positions: list[set[int]] = [{pack_position(0, 0)} for _ in range(max_len)]
+
+    for direction, distance in _commands:
+        dx, dy = moves[direction]
+
+        for _ in range(distance):
+            xs[0] += dx
+            ys[0] += dy
+
+            for i in range(1, max_len):
+                diff_x = xs[i-1] - xs[i]
+                diff_y = ys[i-1] - ys[i]
+
+                # Knot still touches the previous knot, so the rest of the rope doesn't move either
+                if -1 <= diff_x <= 1 and -1 <= diff_y <= 1:
+                    break
+
+                # Move the knot one step towards the previous knot and record it as tail of a shorter rope
+                xs[i] += (diff_x > 0) - (diff_x < 0)
+                ys[i] += (diff_y > 0) - (diff_y < 0)
+                visited_positions[i].add(pack_position(xs[i], ys[i]))
+
+    return {length: len(visited_positions[length-1]) for length in range(2, max_len + 1)}
+
+
+def parse(text: str) -> list[tuple[str, int]]:
+    """
+    Parse the input into directional move commands.
+    :param text: The raw puzzle input.
+    :return: The commands, as direction and distance.
+    """
+    commands = [command.split(' ') for command in text.splitlines()]
+    return [(x, int(y)) for x, y in commands]
+
+
+def part1(commands: list[tuple[str, int]]) -> int:
+    """
+    Count the positions visited by the tail of a rope with 2 knots.
+    :param commands: The commands to run.
+    :return: The number of visited positions.
+    """
+    return len(simulate_rope(commands))
+
+
+def part2(commands: list[tuple[str, int]]) -> int:
+    """
+    Count the positions visited by the tail of a rope with 10 knots.
+    :param commands: The commands to run.
+    :return: The number of visited positions.
+    """
+    return len(simulate_rope(commands, 10))
+
+
+if __name__ == '__main__':
+    input_file = os.path.join(os.path.dirname(__file__), 'input.txt')
+    with open(input_file) as f:
+        parsed = parse(f.read())
+
+    print(f'part1: {part1(parsed)}')
+    print(f'part2: {part2(parsed)}')
@@ -0,0 +1,623 @@
+"""
+Advent of Code 2022: generate synthetic inputs
+"""
+import argparse
+import json
+import math
+import os
+import random
+import string
+import sys
+
+from collections import deque
+from typing import Any, Callable
+
+from run_all import get_input_file, load_solution
+
+
+# Expected answers of part 1 and part 2, None when no reference can compute them
+Answers = tuple[Any, Any]
+
+# Above this number of trees the brute-force reference of day 8 is too slow to be useful
+DAY8_REFERENCE_LIMIT: int = 1_000_000
+
+
+def generate_day1(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the calorie lists of the elves.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    elves = [[rng.randint(1000, 60000) for _ in range(rng.randint(1, 15))] for _ in range(250 * scale)]
+    totals = sorted([sum(elf) for elf in elves], reverse=True)
+
+    text = '\n\n'.join(['\n'.join([str(calories) for calories in elf]) for elf in elves]) + '\n'
+    return text, (totals[0], sum(totals[:3]))
+
+
+def generate_day2(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the rounds of the strategy guide.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    rounds = [(rng.randrange(3), rng.randrange(3)) for _ in range(2500 * scale)]
+
+    # Outcome of a round is 0 for a loss, 1 for a draw and 2 for a win
+    part1 = sum([(y + 1) + 3 * ((y - x + 1) % 3) for x, y in rounds])
+    part2 = sum([((x + y - 1) % 3 + 1) + 3 * y for x, y in rounds])
+
+    text = ''.join([f'{"ABC"[x]} {"XYZ"[y]}\n' for x, y in rounds])
+    return text, (part1, part2)
+
+
+def generate_day3(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the rucksacks, in groups of three sharing exactly one badge type.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    types = string.ascii_lowercase + string.ascii_uppercase
+    rucksacks: list[str] = []
+    part1, part2 = 0, 0
+
+    for _ in range(100 * scale):
+        badge = rng.choice(types)
+        part2 += types.index(badge) + 1
+
+        # Disjoint type pools per elf, so the badge is the only type common to the group
+        pool = [t for t in types if t != badge]
+        rng.shuffle(pool)
+
+        for i in range(3):
+            elf_pool = pool[i*17:(i+1)*17] + [badge]
+            duplicate = rng.choice(elf_pool)
+            part1 += types.index(duplicate) + 1
+
+            # Disjoint type pools per compartment, so the duplicate is the only common type
+            others = [t for t in elf_pool if t != duplicate]
+            rng.shuffle(others)
+            left_pool, right_pool = others[:len(others)//2], others[len(others)//2:]
+
+            size = rng.randint(4, 24)
+            left = [duplicate] + [rng.choice(left_pool) for _ in range(size - 1)]
+            right = [duplicate] + [rng.choice(right_pool) for _ in range(size - 1)]
+
+            # Make sure the badge is part of the rucksack
+            if badge != duplicate:
+                (left if badge in left_pool else right)[-1] = badge
+
+            rng.shuffle(left)
+            rng.shuffle(right)
+            rucksacks.append(''.join(left + right))
+
+    return '\n'.join(rucksacks) + '\n', (part1, part2)
+
+
+def generate_day4(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the section assignments of the pairs of elves.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    lines: list[str] = []
+    part1, part2 = 0, 0
+
+    for _ in range(1000 * scale):
+        a, b = sorted([rng.randint(1, 99), rng.randint(1, 99)])
+        c, d = sorted([rng.randint(1, 99), rng.randint(1, 99)])
+        part1 += int((a <= c and d <= b) or (c <= a and b <= d))
+        part2 += int(max(a, c) <= min(b, d))
+        lines.append(f'{a}-{b},{c}-{d}')
+
+    return '\n'.join(lines) + '\n', (part1, part2)
+
+
+def generate_day5(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the starting stacks and a procedure that never empties a stack.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    # The stack labels only support up to 9 stacks, scale the height instead
+    n_stacks = 9
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8 * scale))]
+              for _ in range(n_stacks)]
+
+    # Render the stacks top-down
+    height = max([len(stack) for stack in stacks])
+    lines = [
+        ' '.join([f'[{stack[level]}]' if level < len(stack) else '   ' for stack in stacks])
+        for level in range(height - 1, -1, -1)
+    ]
+    lines.append(' ' + '   '.join([str(i + 1) for i in range(n_stacks)]))
+
+    # Generate and perform the steps with both crate movers
+    stacks_9000 = [list(stack) for stack in stacks]
+    stacks_9001 = [list(stack) for stack in stacks]
+    lines.append('')
+    for _ in range(500 * scale):
+        from_stack = rng.choice([i for i, stack in enumerate(stacks_9000) if len(stack) > 1])
+        to_stack = rng.choice([i for i in range(n_stacks) if i != from_stack])
+        n = rng.randint(1, min(len(stacks_9000[from_stack]) - 1, 40))
+        lines.append(f'move {n} from {from_stack + 1} to {to_stack + 1}')
+
+        crates = stacks_9000[from_stack][-n:]
+        del stacks_9000[from_stack][-n:]
+        stacks_9000[to_stack].extend(reversed(crates))
+
+        crates = stacks_9001[from_stack][-n:]
+        del stacks_9001[from_stack][-n:]
+        stacks_9001[to_stack].extend(crates)
+
+    # The procedure only ever moves crates between stacks that keep at least one crate
+    part1 = ''.join([stack[-1] for stack in stacks_9000])
+    part2 = ''.join([stack[-1] for stack in stacks_9001])
+    return '\n'.join(lines) + '\n', (part1, part2)
+
+
+def generate_day6(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate a signal with its start-of-packet marker halfway and start-of-message marker near the end.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    length = 4096 * scale
+
+    # Too few distinct characters for a marker of 4, then for a marker of 14
+    signal = [rng.choice('abc') for _ in range(length // 2)]
+    signal += [rng.choice(string.ascii_lowercase[:13]) for _ in range(length * 9 // 10 - len(signal))]
+    signal += rng.sample(string.ascii_lowercase, 14)
+    signal += [rng.choice(string.ascii_lowercase) for _ in range(length - len(signal))]
+
+    def _marker_index(marker_len: int) -> int:
+        """
+        Find the marker by checking every window, as a brute-force reference.
+        :param marker_len: The length of the marker.
+        :return: The number of characters processed before the marker is complete.
+        """
+        for i in range(marker_len, len(signal) + 1):
+            if len(set(signal[i-marker_len:i])) == marker_len:
+                return i
+
+    return ''.join(signal) + '\n', (_marker_index(4), _marker_index(14))
+
+
+def generate_day7(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the terminal output of browsing a random directory tree.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    n_dirs, n_files = 180 * scale, 300 * scale
+
+    # Directory tree as lists of children, attaching each directory to a random earlier one
+    parents = [-1] + [rng.randrange(i) for i in range(1, n_dirs)]
+    children: list[list[int]] = [[] for _ in range(n_dirs)]
+    for i in range(1, n_dirs):
+        children[parents[i]].append(i)
+
+    # Spread the files so the total disk usage stays in a realistic range
+    max_file_size = max(1, 2 * 50_000_000 // n_files)
+    files: list[list[int]] = [[] for _ in range(n_dirs)]
+    for _ in range(n_files):
+        files[rng.randrange(n_dirs)].append(rng.randint(1, max_file_size))
+
+    # Total sizes, children always have a higher index than their parent
+    sizes = [sum(dir_files) for dir_files in files]
+    for i in range(n_dirs - 1, 0, -1):
+        sizes[parents[i]] += sizes[i]
+
+    def _unique_names(n: int, suffix: str = '') -> list[str]:
+        """
+        Generate unique names for the entries of a single directory.
+        :param n: The number of names.
+        :param suffix: The suffix added to each name.
+        :return: The names.
+        """
+        names: set[str] = set()
+        while len(names) < n:
+            names.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))) + suffix)
+        return list(names)
+
+    # Browse the tree depth-first, the stack holds lines still to output after the current directory
+    lines: list[str] = ['$ cd /']
+    stack: list[int | str] = [0]
+    while stack:
+        entry = stack.pop()
+
+        # Line to output on the way back up
+        if isinstance(entry, str):
+            lines.append(entry)
+            continue
+
+        dir_names = _unique_names(len(children[entry]))
+        file_names = _unique_names(len(files[entry]), '.txt')
+        lines.append('$ ls')
+        lines.extend([f'dir {name}' for name in dir_names])
+        lines.extend([f'{size} {name}' for size, name in zip(files[entry], file_names)])
+
+        for child, name in reversed(list(zip(children[entry], dir_names))):
+            stack.extend(['$ cd ..', child, f'$ cd {name}'])
+
+    min_dir_size = 30_000_000 - (70_000_000 - sizes[0])
+    part1 = sum([size for size in sizes if size <= 100_000])
+    part2 = min([size for size in sizes if size >= min_dir_size])
+    return '\n'.join(lines) + '\n', (part1, part2)
+
+
+def generate_day8(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate a square height map of trees.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers, only for maps the reference can handle.
+    """
+    size = round(99 * math.sqrt(scale))
+    rows = [[rng.randint(0, 9) for _ in range(size)] for _ in range(size)]
+    text = '\n'.join([''.join(map(str, row)) for row in rows]) + '\n'
+
+    if size * size > DAY8_REFERENCE_LIMIT:
+        return text, (None, None)
+
+    cols = [list(col) for col in zip(*rows)]
+    visible, best_score = 0, 0
+    for r in range(size):
+        for c in range(size):
+            h = rows[r][c]
+
+            # Lines of sight, ordered outward from the tree
+            sight_lines = (rows[r][c-1::-1] if c else [], rows[r][c+1:],
+                           cols[c][r-1::-1] if r else [], cols[c][r+1:])
+            visible += int(any([not line or max(line) < h for line in sight_lines]))
+
+            score = 1
+            for line in sight_lines:
+                blocking = [i for i, other in enumerate(line) if other >= h]
+                score *= blocking[0] + 1 if blocking else len(line)
+            best_score = max(best_score, score)
+
+    return text, (visible, best_score)
+
+
+def generate_day9(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the motions of the head of the rope.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    commands = [(rng.choice('RLUD'), rng.randint(1, 19)) for _ in range(2000 * scale)]
+    moves = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
+
+    # Simulate a rope of 10 knots, the second knot is the tail of a rope of 2 knots
+    knots = [[0, 0] for _ in range(10)]
+    visited_2, visited_10 = {(0, 0)}, {(0, 0)}
+    for direction, distance in commands:
+        dx, dy = moves[direction]
+        for _ in range(distance):
+            knots[0][0] += dx
+            knots[0][1] += dy
+            for prev, knot in zip(knots, knots[1:]):
+                diff_x, diff_y = prev[0] - knot[0], prev[1] - knot[1]
+                if abs(diff_x) > 1 or abs(diff_y) > 1:
+                    knot[0] += (diff_x > 0) - (diff_x < 0)
+                    knot[1] += (diff_y > 0) - (diff_y < 0)
+            visited_2.add(tuple(knots[1]))
+            visited_10.add(tuple(knots[9]))
+
+    text = ''.join([f'{direction} {distance}\n' for direction, distance in commands])
+    return text, (len(visited_2), len(visited_10))
+
+
+def generate_day10(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate a CPU program running for at least the 240 cycles drawn on the CRT.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers, the rendered image is not checked.
+    """
+    instructions: list[str] = []
+    x_values: list[int] = [1]
+    while len(instructions) < 146 * scale or len(x_values) < 240:
+        if rng.random() < 0.3:
+            instructions.append('noop')
+            x_values.append(x_values[-1])
+            continue
+
+        value = rng.randint(-10, 10)
+        instructions.append(f'addx {value}')
+        x_values.extend([x_values[-1], x_values[-1] + value])
+
+    part1 = sum([x_values[cycle - 1] * cycle for cycle in range(20, 221, 40)])
+    return '\n'.join(instructions) + '\n', (part1, None)
+
+
+def generate_day11(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the notes on the monkeys.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    def _monkey_business(rounds: int, relief: int) -> int:
+        """
+        Play the game item by item, as a reference.
+        :param rounds: The number of rounds to play.
+        :param relief: The divisor of the worry level after each inspection.
+        :return: The product of the two highest numbers of inspected items.
+        """
+        # Without relief, worry levels only matter modulo the product of the divisors
+        modulus = math.prod(divisors) if relief == 1 else None
+        held = [list(monkey_items) for monkey_items in items]
+        inspected = [0] * n_monkeys
+
+        for _ in range(rounds):
+            for i in range(n_monkeys):
+                inspected[i] += len(held[i])
+                for worry in held[i]:
+                    operand = worry if operations[i] == '* old' else int(operations[i][2:])
+                    worry = (worry * operand if operations[i][0] == '*' else worry + operand) // relief
+                    worry = worry % modulus if modulus else worry
+                    held[throws[i][worry % divisors[i] != 0]].append(worry)
+                held[i] = []
+
+        top1, top2 = sorted(inspected, reverse=True)[:2]
+        return top1 * top2
+
+    n_monkeys = 8
+    divisors = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], n_monkeys)
+    operations = ['* old'] + [f'* {rng.randint(2, 19)}' for _ in range(2)] \
+        + [f'+ {rng.randint(1, 8)}' for _ in range(n_monkeys - 3)]
+    rng.shuffle(operations)
+
+    monkeys: list[str] = []
+    items: list[list[int]] = []
+    throws: list[tuple[int, int]] = []
+    for i in range(n_monkeys):
+        items.append([rng.randint(50, 99) for _ in range(rng.randint(1, 8) * scale)])
+        if_true, if_false = rng.sample([j for j in range(n_monkeys) if j != i], 2)
+        throws.append((if_true, if_false))
+        monkeys.append('\n'.join([
+            f'Monkey {i}:',
+            f'  Starting items: {", ".join(map(str, items[i]))}',
+            f'  Operation: new = old {operations[i]}',
+            f'  Test: divisible by {divisors[i]}',
+            f'    If true: throw to monkey {if_true}',
+            f'    If false: throw to monkey {if_false}',
+        ]))
+
+    return '\n\n'.join(monkeys) + '\n', (_monkey_business(20, 3), _monkey_business(10000, 1))
+
+
+def generate_day12(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate a height map rising from west to east, with one clean path from start to goal.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    n_rows = round(41 * math.sqrt(scale))
+    n_cols = max(26, round(171 * math.sqrt(scale)))
+    clean_row = rng.randrange(n_rows)
+
+    # Randomly lower cells, except on the clean row
+    heights = [[c * 26 // n_cols for c in range(n_cols)] for _ in range(n_rows)]
+    for r in range(n_rows):
+        for c in range(n_cols):
+            if r != clean_row and rng.random() < 0.3:
+                heights[r][c] = max(0, heights[r][c] - rng.randint(1, 3))
+
+    def _least_steps(sources: list[tuple[int, int]], goal: tuple[int, int]) -> int:
+        """
+        Breadth-first search from all sources at once, as a reference.
+        :param sources: The starting positions.
+        :param goal: The goal position.
+        :return: The least amount of steps from any source to the goal.
+        """
+        steps = {source: 0 for source in sources}
+        queue = deque(sources)
+        while queue:
+            r, c = queue.popleft()
+            if (r, c) == goal:
+                return steps[(r, c)]
+
+            for new_r, new_c in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if (0 <= new_r < n_rows and 0 <= new_c < n_cols and (new_r, new_c) not in steps
+                        and heights[new_r][new_c] <= heights[r][c] + 1):
+                    steps[(new_r, new_c)] = steps[(r, c)] + 1
+                    queue.append((new_r, new_c))
+
+    start, goal = (clean_row, 0), (clean_row, n_cols - 1)
+    lowest = [(r, c) for r in range(n_rows) for c in range(n_cols) if heights[r][c] == 0]
+    answers = (_least_steps([start], goal), _least_steps(lowest, goal))
+
+    grid = [[chr(ord('a') + h) for h in row] for row in heights]
+    grid[start[0]][start[1]] = 'S'
+    grid[goal[0]][goal[1]] = 'E'
+    return '\n'.join([''.join(row) for row in grid]) + '\n', answers
+
+
+def generate_day13(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate pairs of nested packets.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    def _compare(left: Any, right: Any) -> int:
+        """
+        Compare two packet values, as a reference.
+        :param left: The left value.
+        :param right: The right value.
+        :return: A negative number if left comes first, positive if right comes first, else 0.
+        """
+        if isinstance(left, int) and isinstance(right, int):
+            return left - right
+        left = [left] if isinstance(left, int) else left
+        right = [right] if isinstance(right, int) else right
+        for left_value, right_value in zip(left, right):
+            if result := _compare(left_value, right_value):
+                return result
+        return len(left) - len(right)
+
+    def _packet(depth: int = 0) -> list:
+        """
+        Generate a random packet.
+        :param depth: The current nesting depth.
+        :return: The packet.
+        """
+        return [rng.randint(0, 10) if depth > 3 or rng.random() < 0.6 else _packet(depth + 1)
+                for _ in range(rng.randint(0, 5))]
+
+    # Packets equal to a divider packet make the position of the divider ambiguous
+    packets: list[list] = []
+    while len(packets) < 300 * scale:
+        packet = _packet()
+        if _compare(packet, [[2]]) and _compare(packet, [[6]]):
+            packets.append(packet)
+
+    pairs = list(zip(packets[::2], packets[1::2]))
+    part1 = sum([i + 1 for i, (left, right) in enumerate(pairs) if _compare(left, right) < 0])
+    part2 = ((sum([_compare(packet, [[2]]) < 0 for packet in packets]) + 1)
+             * (sum([_compare(packet, [[6]]) < 0 for packet in packets]) + 2))
+
+    text = '\n\n'.join([
+        f'{json.dumps(left, separators=(",", ":"))}\n{json.dumps(right, separators=(",", ":"))}'
+        for left, right in pairs
+    ])
+    return text + '\n', (part1, part2)
+
+
+def generate_day14(rng: random.Random, scale: int) -> tuple[str, Answers]:
+    """
+    Generate the paths of rock, spreading wider and deeper with the scale.
+    :param rng: The random number generator.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :return: The input and its expected answers.
+    """
+    def _pour_sand(rocks: set[tuple[int, int]], has_floor: bool) -> int:
+        """
+        Pour sand until it flows into the abyss or blocks the source, as a reference.
+        The path of the previous unit is kept, so each unit starts falling from where the last one came to rest.
+        :param rocks: The points of rock.
+        :param has_floor: Whether there is a floor two below the lowest rock, else sand falls into the abyss.
+        :return: The number of units of sand that came to rest.
+        """
+        blocked = set(rocks)
+        max_y = max([y for _, y in rocks])
+        path = [(500, 0)]
+        units = 0
+
+        while path:
+            x, y = path[-1]
+            if not has_floor and y > max_y:
+                break
+
+            # Fall to the first free point below, unless resting on the floor
+            below = [(x + dx, y + 1) for dx in (0, -1, 1)] if not has_floor or y + 1 < max_y + 2 else []
+            free = [point for point in below if point not in blocked]
+            if free:
+                path.append(free[0])
+                continue
+
+            blocked.add(path.pop())
+            units += 1
+
+        return units
+
+    width, depth = round(100 * math.sqrt(scale)), round(170 * math.sqrt(scale))
+    lines: list[str] = []
+    rocks: set[tuple[int, int]] = set()
+
+    for _ in range(150 * scale):
+        # Coordinates of 0 are not supported by the parser
+        x, y = max(1, 500 + rng.randint(-width // 2, width // 2)), rng.randint(2, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 4)):
+            # Alternate between horizontal and vertical segments
+            if i % 2 == 0:
+                x = max(1, x + rng.choice([-1, 1]) * rng.randint(1, 8))
+            else:
+                y = max(1, y + rng.choice([-1, 1]) * rng.randint(1, 8))
+            points.append((x, y))
+        lines.append(' -> '.join([f'{x},{y}' for x, y in points]))
+
+        # Rock on every point of each segment
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            rocks.update([(x, y) for x in range(min(x1, x2), max(x1, x2) + 1)
+                          for y in range(min(y1, y2), max(y1, y2) + 1)])
+
+    return '\n'.join(lines) + '\n', (_pour_sand(rocks, False), _pour_sand(rocks, True))
+
+
+GENERATORS: dict[int, Callable[[random.Random, int], tuple[str, Answers]]] = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+}
+
+
+def generate(day: int, scale: int = 1, seed: int = 0) -> tuple[str, Answers]:
+    """
+    Generate a synthetic input for a day.
+    :param day: The day number.
+    :param scale: The scale factor relative to a regular puzzle input.
+    :param seed: The seed of the random number generator.
+    :return: The input and the expected answers of part 1 and part 2 (None if unknown).
+    """
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate synthetic Advent of Code 2022 inputs.')
+    parser.add_argument('days', nargs='*', type=int, help='day numbers to generate inputs for (default: all)')
+    parser.add_argument('-s', '--scale', type=int, default=10, help='scale factor of the input (default: 10)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random number generator (default: 0)')
+    parser.add_argument('-c', '--check', action='store_true', help='run the solutions and check their answers')
+    args = parser.parse_args()
+
+    failed = False
+    for day in args.days or sorted(GENERATORS):
+        text, answers = generate(day, args.scale, args.seed)
+
+        input_file = get_input_file(f'day{day}', args.scale)
+        with open(input_file, 'w') as f:
+            f.write(text)
+        print(f'day {day}: wrote {os.path.relpath(input_file)}, expected answers {answers}')
+
+        if not args.check:
+            continue
+
+        solution = load_solution(f'day{day}')
+        parsed = solution.parse(text)
+        for part, expected in enumerate(answers, start=1):
+            # No reference answer available
+            if expected is None:
+                continue
+
+            actual = getattr(solution, f'part{part}')(parsed)
+            if actual != expected:
+                failed = True
+                print(f'day {day}: part {part} gave {actual}, expected {expected}')
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,59 @@
+"""
+Advent of Code 2022: shared input loader
+"""
+import mmap
+import os
+
+from types import ModuleType
+
+
+# Inputs already loaded by this process, by real path
+mapped_inputs: dict[str, memoryview] = {}
+decoded_inputs: dict[str, str] = {}
+
+
+def load_input(path: str) -> memoryview:
+    """
+    Memory-map an input file, read-only and at most once per process.
+    Slicing the returned view does not copy the underlying data.
+    :param path: The path of the input file.
+    :return: A view on the raw bytes of the input.
+    """
+    path = os.path.realpath(path)
+
+    if path not in mapped_inputs:
+        with open(path, 'rb') as f:
+            # Empty files cannot be memory-mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                mapped_inputs[path] = memoryview(b'')
+            else:
+                # The mapping stays valid after the file is closed
+                mapped_inputs[path] = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    return mapped_inputs[path]
+
+
+def load_text(path: str) -> str:
+    """
+    Load an input file as text, decoding the mapped input at most once per process.
+    CRLF line endings are converted to LF, like reading the file in text mode does.
+    :param path: The path of the input file.
+    :return: The text of the input.
+    """
+    path = os.path.realpath(path)
+
+    if path not in decoded_inputs:
+        decoded_inputs[path] = str(load_input(path), 'utf-8').replace('\r\n', '\n')
+
+    return decoded_inputs[path]
+
+
+def load_parse_input(solution: ModuleType, path: str) -> str | memoryview:
+    """
+    Load an input file in the form taken by the parse function of a solution.
+    Solutions setting RAW_INPUT get the mapped bytes, so their input is never decoded.
+    :param solution: The solution module.
+    :param path: The path of the input file.
+    :return: The raw bytes or the text of the input.
+    """
+    return load_input(path) if getattr(solution, 'RAW_INPUT', False) else load_text(path)
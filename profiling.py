@@ -0,0 +1,66 @@
+"""
+Advent of Code 2022: low-overhead sampling profiler
+"""
+import signal
+
+from collections import Counter
+from types import CodeType, FrameType
+
+
+class SamplingProfiler:
+    """Sampling profiler, records the call stack of the main thread on a CPU-time interval timer."""
+    def __init__(self, interval: float = 0.001) -> None:
+        """
+        Initialize a sampling profiler.
+        :param interval: The CPU time between two samples in seconds.
+        """
+        self._interval: float = interval
+        self._samples: int = 0
+        self._self_counts: Counter[CodeType] = Counter()
+        self._cumulative_counts: Counter[CodeType] = Counter()
+
+    @property
+    def samples(self) -> int:
+        """Get the number of samples taken."""
+        return self._samples
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        """
+        Record the interrupted call stack, used as signal handler.
+        :param signum: The signal number.
+        :param frame: The frame that was executing when the signal arrived.
+        """
+        self._samples += 1
+        if frame is None:
+            return
+
+        self._self_counts[frame.f_code] += 1
+
+        # Count every function on the stack once, also for recursive calls
+        stack: set[CodeType] = set()
+        while frame is not None:
+            stack.add(frame.f_code)
+            frame = frame.f_back
+        self._cumulative_counts.update(stack)
+
+    def start(self) -> None:
+        """Start sampling, only possible from the main thread."""
+        signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def print_stats(self, top: int = 20) -> None:
+        """
+        Print the functions that were on the stack most often.
+        :param top: The number of functions to print.
+        """
+        print(f'{self._samples} samples taken every {self._interval * 1000:g} ms of CPU time')
+        print(f'{"self %":>8} {"cumul %":>8}  function')
+        for code, count in self._cumulative_counts.most_common(top):
+            self_pct = 100 * self._self_counts[code] / self._samples
+            print(f'{self_pct:>8.1f} {100 * count / self._samples:>8.1f}  '
+                  f'{code.co_filename}:{code.co_firstlineno}({code.co_name})')
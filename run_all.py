@@ -1,20 +1,228 @@
 """
 Advent of Code 2022: run all days
 """
+import argparse
+import cProfile
+import importlib.util
 import os
+import pstats
+import sys
 import time
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from types import ModuleType
+from typing import Any, Callable
 
-# Get all solution folders in the current directory
-days = [f for f in os.listdir('.') if os.path.isdir(f) and f.startswith('day')]
+from loader import load_parse_input
+from profiling import SamplingProfiler
 
-# Run and time all solutions
-print('-'*22)
-print(f'| {"Day":3} | {"Time elapsed":12} |')
-print('-'*22)
-for day in days:
-    start = time.time()
-    os.system(f'python3 {day}/solution.py > /dev/null')
-    end = time.time()
-    print(f'| {day.replace("day", ""):>3} | {end - start:>12.3f} |')
-print('-'*22)
+
+ROOT_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_days() -> list[str]:
+    """
+    Get all solution folders in the repository, ordered by day number.
+    :return: The names of the solution folders.
+    """
+    days = [f for f in os.listdir(ROOT_DIR) if os.path.isdir(os.path.join(ROOT_DIR, f)) and f.startswith('day')]
+    return sorted(days, key=lambda day: int(day.replace('day', '')))
+
+
+def load_solution(day: str) -> ModuleType:
+    """
+    Import the solution module of a day, without running its puzzle.
+    :param day: The name of the solution folder.
+    :return: The imported module, exposing 'parse', 'part1' and 'part2'.
+    """
+    spec = importlib.util.spec_from_file_location(f'{day}_solution', os.path.join(ROOT_DIR, day, 'solution.py'))
+    module = importlib.util.module_from_spec(spec)
+
+    # Register the module, so its functions can be pickled for worker processes
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_input_file(day: str, scale: int = None) -> str:
+    """
+    Get the input file of a day.
+    :param day: The name of the solution folder.
+    :param scale: The scale of a generated input to use instead of the puzzle input, if any.
+    :return: The path of the input file.
+    """
+    return os.path.join(ROOT_DIR, day, f'input_x{scale}.txt' if scale else 'input.txt')
+
+
+def timed(func: Callable, *args: Any) -> tuple[Any, float]:
+    """
+    Call a function and measure the time it takes.
+    :param func: The function to call.
+    :param args: The arguments to pass to the function.
+    :return: The result of the call and the elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def load_day(day: str, scale: int = None) -> tuple[ModuleType, str | memoryview]:
+    """
+    Load the solution of a day and its input, kept apart from running it so neither is timed or profiled.
+    :param day: The name of the solution folder.
+    :param scale: The scale of a generated input to use instead of the puzzle input, if any.
+    :return: The solution module and its input.
+    """
+    solution = load_solution(day)
+    return solution, load_parse_input(solution, get_input_file(day, scale))
+
+
+def time_day(solution: ModuleType, text: str | memoryview) -> tuple[float, float, float]:
+    """
+    Run a loaded solution in-process and time each stage.
+    :param solution: The solution module.
+    :param text: The input of the solution.
+    :return: The elapsed time of parsing, part 1 and part 2 in seconds.
+    """
+    parsed, parse_time = timed(solution.parse, text)
+    _, part1_time = timed(solution.part1, parsed)
+    _, part2_time = timed(solution.part2, parsed)
+    return parse_time, part1_time, part2_time
+
+
+def run_day(day: str, scale: int = None) -> tuple[float, float, float]:
+    """
+    Run the solution of a day in-process and time each stage.
+    :param day: The name of the solution folder.
+    :param scale: The scale of a generated input to use instead of the puzzle input, if any.
+    :return: The elapsed time of parsing, part 1 and part 2 in seconds.
+    """
+    return time_day(*load_day(day, scale))
+
+
+def run_day_job(day: str, scale: int = None) -> tuple[str, tuple[float, float, float], float]:
+    """
+    Run the solution of a day, also measuring the CPU time spent on it.
+    Used as the unit of work for the process pool.
+    :param day: The name of the solution folder.
+    :param scale: The scale of a generated input to use instead of the puzzle input, if any.
+    :return: The day, the elapsed time of parsing, part 1 and part 2, and the CPU time in seconds.
+    """
+    start = time.process_time()
+    times = run_day(day, scale)
+    return day, times, time.process_time() - start
+
+
+def format_row(day: str, times: tuple[float, float, float]) -> str:
+    """
+    Format the timings of a day as a table row.
+    :param day: The name of the solution folder.
+    :param times: The elapsed time of parsing, part 1 and part 2 in seconds.
+    :return: The table row.
+    """
+    return f'| {day.replace("day", ""):>3} | ' + ' | '.join([f'{t:>8.3f}' for t in (*times, sum(times))]) + ' |'
+
+
+def run_all(days: list[str], jobs: int = 1, scale: int = None) -> None:
+    """
+    Run and time the given days, printing each row as soon as all preceding days have finished.
+    :param days: The names of the solution folders, ordered by day number.
+    :param jobs: The number of worker processes, 1 runs all days in this process.
+    :param scale: The scale of the generated inputs to use instead of the puzzle inputs, if any.
+    """
+    print('-'*54)
+    print(f'| {"Day":3} | {"Parse":8} | {"Part 1":8} | {"Part 2":8} | {"Total":8} |')
+    print('-'*54)
+
+    start = time.perf_counter()
+    cpu_time = 0.0
+
+    if jobs == 1:
+        for day in days:
+            _, times, day_cpu_time = run_day_job(day, scale)
+            cpu_time += day_cpu_time
+            print(format_row(day, times), flush=True)
+    else:
+        # Results arrive in completion order, buffer them until they can be printed in day order
+        finished: dict[str, tuple[float, float, float]] = {}
+        next_idx = 0
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(run_day_job, day, scale) for day in days]
+            for future in as_completed(futures):
+                day, times, day_cpu_time = future.result()
+                finished[day] = times
+                cpu_time += day_cpu_time
+
+                # Flush all rows that are next in line
+                while next_idx < len(days) and days[next_idx] in finished:
+                    print(format_row(days[next_idx], finished[days[next_idx]]), flush=True)
+                    next_idx += 1
+
+    wall_time = time.perf_counter() - start
+    print('-'*54)
+    print(f'Wall time: {wall_time:.3f}s, CPU time: {cpu_time:.3f}s, speedup: {cpu_time / wall_time:.2f}x')
+
+
+def profile_days(days: list[str], scale: int = None, top: int = 20,
+                 sampling: bool = False, interval: float = 0.001, output_dir: str = 'profiles') -> None:
+    """
+    Run the given days under a profiler and print the functions with the most cumulative time.
+    With cProfile, the statistics of each day are also dumped to '<output_dir>/<day>.pstats'.
+    :param days: The names of the solution folders.
+    :param scale: The scale of the generated inputs to use instead of the puzzle inputs, if any.
+    :param top: The number of functions to print per day.
+    :param sampling: Whether to use the sampling profiler instead of cProfile.
+    :param interval: The CPU time between two samples of the sampling profiler in seconds.
+    :param output_dir: The directory to dump the cProfile statistics in.
+    """
+    for day in days:
+        print(f'===== {day} =====')
+
+        # Only the solution itself is profiled, not importing it or loading its input
+        solution, text = load_day(day, scale)
+
+        # Low overhead, suitable for large inputs
+        if sampling:
+            profiler = SamplingProfiler(interval)
+            profiler.start()
+            try:
+                time_day(solution, text)
+            finally:
+                profiler.stop()
+            profiler.print_stats(top)
+            continue
+
+        profiler = cProfile.Profile()
+        profiler.runcall(time_day, solution, text)
+
+        os.makedirs(output_dir, exist_ok=True)
+        stats_file = os.path.join(output_dir, f'{day}.pstats')
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(stats_file)
+        print(f'Profile written to {stats_file}')
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run and time all Advent of Code 2022 solutions.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of days to run in parallel (default: 1)')
+    parser.add_argument('-s', '--scale', type=int,
+                        help='run on the generated inputs of this scale instead of input.txt')
+    parser.add_argument('-p', '--profile', type=int, nargs='*', metavar='DAY',
+                        help='profile the given days (default: all) instead of timing them')
+    parser.add_argument('--top', type=int, default=20,
+                        help='number of functions to print per profiled day (default: 20)')
+    parser.add_argument('--sampling', action='store_true',
+                        help='profile with the low-overhead sampling profiler instead of cProfile')
+    parser.add_argument('--interval', type=float, default=0.001,
+                        help='CPU time between samples of the sampling profiler in seconds (default: 0.001)')
+    parser.add_argument('--profile-dir', default='profiles',
+                        help='directory to write the .pstats files to (default: profiles)')
+    args = parser.parse_args()
+
+    if args.profile is not None:
+        days = [f'day{day}' for day in args.profile] if args.profile else get_days()
+        profile_days(days, args.scale, args.top, args.sampling, args.interval, args.profile_dir)
+    else:
+        run_all(get_days(), max(1, args.jobs), args.scale)